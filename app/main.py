@@ -1,53 +1,102 @@
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, RedirectResponse, Response
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.routing import Route
 from app.routers import lobby_routes, ws_routes
+from app.utils.cors import FastCORSMiddleware
+from app.utils.log_queue import start_queue_logging
+from app.utils.static_files import CachedStaticFiles
+from contextlib import asynccontextmanager
+from pathlib import Path
+import anyio.to_thread
+import orjson
 import os
 
+# Interactive docs and the OpenAPI schema are only built in debug mode
+DEBUG = os.getenv("DEBUG", "").lower() in ("1", "true")
+
+# Threadpool size for sync (`def`) endpoints and run_in_threadpool calls.
+# Anything doing blocking I/O must be a plain `def` so it lands here
+# instead of stalling the event loop; AnyIO's default of 40 is low.
+THREADPOOL_TOKENS = 200
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Startup/shutdown hooks."""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_TOKENS
+    # Log handlers write from a background thread, never from the event loop
+    stop_queue_logging = start_queue_logging()
+    # Build the OpenAPI schema before serving rather than on the first /docs hit
+    if app.openapi_url:
+        app.openapi()
+    yield
+    stop_queue_logging()
+
+# No default_response_class: every route declares a return type, so FastAPI
+# serializes responses straight to JSON bytes with pydantic-core. Setting a
+# custom class (e.g. the now-deprecated ORJSONResponse) would disable that.
+# Keep annotating new routes' return types to stay on this path.
 app = FastAPI(
     title="Party Game Platform",
     description="A lightweight, browser-based party game platform",
-    version="1.0.0"
+    version="1.0.0",
+    openapi_url="/openapi.json" if DEBUG else None,
+    docs_url="/docs" if DEBUG else None,
+    redoc_url=None,
+    lifespan=lifespan
 )
 
-# CORS middleware for development
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Gzip bodies over 512 bytes (lobby JSON, the test client's HTML/JS);
+# tiny replies like /health go out as-is
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
 
-# Include routers
-app.include_router(lobby_routes.router)
-app.include_router(ws_routes.router)
+# CORS middleware (pure ASGI, allows any origin); added last so it is the
+# outermost layer and preflights are answered before anything else runs
+app.add_middleware(FastCORSMiddleware)
 
-# Static files for test client
-static_dir = os.path.join(os.path.dirname(__file__), "..", "static")
-if os.path.exists(static_dir):
-    app.mount("/static", StaticFiles(directory=static_dir), name="static")
+# Register router routes directly; APIRouter already baked the "/lobby"
+# prefix and tags into each route, so include_router would only rebuild them
+app.router.routes.extend(lobby_routes.router.routes)
+app.router.routes.extend(ws_routes.router.routes)
 
-@app.get("/")
-async def root():
-    """Root endpoint - redirect to game."""
-    from fastapi.responses import RedirectResponse
-    return RedirectResponse(url="/static/index.html")
+# Static files for test client (path resolved once; routers read app.state.static_dir).
+# Mounted unconditionally: a missing directory fails at startup instead of
+# quietly serving 404s for the whole client.
+STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+app.state.static_dir = STATIC_DIR
+app.mount("/static", CachedStaticFiles(directory=str(STATIC_DIR)), name="static")
 
-@app.get("/info")
-async def info():
-    """Info endpoint with basic info."""
-    return {
+# Constant responses, built once at import and returned as-is
+_ROOT_RESPONSE = RedirectResponse(url="/static/index.html")
+_INFO_RESPONSE = Response(
+    content=orjson.dumps({
         "name": "Party Game Platform",
         "version": "1.0.0",
         "status": "running",
         "endpoints": {
-            "docs": "/docs",
+            **({"docs": "/docs"} if DEBUG else {}),
             "test_client": "/static/index.html"
         }
-    }
+    }),
+    media_type="application/json"
+)
+_HEALTH_RESPONSE = PlainTextResponse("ok")
+
+# These are plain Starlette routes (no FastAPI dependency solving or
+# response serialization) since their replies never change.
+async def root(request):
+    """Root endpoint - redirect to game."""
+    return _ROOT_RESPONSE
 
-@app.get("/health")
-async def health_check():
+async def info(request):
+    """Info endpoint with basic info."""
+    return _INFO_RESPONSE
+
+async def health_check(request):
     """Health check endpoint."""
-    return {"status": "healthy"}
+    return _HEALTH_RESPONSE
+
+# "/" goes first so the most common hit matches on the first compare
+app.router.routes.insert(0, Route("/", root, methods=["GET"]))
+app.router.routes.append(Route("/info", info, methods=["GET"]))
+app.router.routes.append(Route("/health", health_check, methods=["GET"]))
@@ -1,15 +1,174 @@
 import asyncio
+import logging
 import time
 import random
-from typing import Dict, List
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
 from app.schemas.game import (
     TapGauntletData, BuzzerTriviaData, GameState, GameType, GameResults, PlayerScore,
     WSEvent, WSEventType, TapAction, TapResponseAction, VoteCategoryAction, BuzzerAction, 
     AwardPointsAction, NextQuestionAction, EndGameAction
 )
 from app.schemas.lobby import Lobby
-from app.utils.chatgpt import get_ai_question
-from app.utils.storage import get_storage
+from app.utils.chatgpt import chatgpt_generator, get_ai_question
+from app.utils.storage import get_storage_sync
+
+logger = logging.getLogger(__name__)
+
+# Lobbies with a game in progress. Player actions (taps, votes, buzzes)
+# read and mutate these directly and mark them dirty; the game loop writes
+# them back to storage every few ticks or per phase, not on every action.
+_active_lobbies: Dict[str, Lobby] = {}
+_dirty_lobbies: Set[str] = set()
+
+# Set by the buzz handler while a lobby's buzzer round is open, so the
+# round task knows someone buzzed without re-reading the lobby
+_buzz_events: Dict[str, asyncio.Event] = {}
+
+# Set by the buzz handler once every player in the lobby has buzzed, so the
+# round closes the buzzer window early instead of idling out the countdown
+_all_buzzed_events: Dict[str, asyncio.Event] = {}
+
+# Who has buzzed in the current question, alongside game_data.buzzers, so
+# the duplicate-buzz check is a set lookup instead of a scan
+_buzzed_players: Dict[str, Set[str]] = {}
+
+# Pending live_buzzers broadcast per lobby. Buzzes landing within
+# LIVE_BUZZERS_WINDOW of each other share one broadcast of the new entries.
+_live_buzzer_flushes: Dict[str, asyncio.Task] = {}
+LIVE_BUZZERS_WINDOW = 0.03
+
+# Next AI question per lobby as (category, task), fetched in the background
+# once the host has used generate_question so the next press is instant
+_ai_prefetch: Dict[str, Tuple[str, asyncio.Task]] = {}
+
+# Set by the host's next_question to cut short the pause a lobby's game
+# loop is currently in (see _pause)
+_pacing_events: Dict[str, asyncio.Event] = {}
+
+# Shuffled questions still unasked in each trivia game's category, so a
+# game doesn't repeat a question until the whole category has been used
+_question_decks: Dict[str, List[Tuple[str, str]]] = {}
+
+# One RNG per lobby with a game running (seeded from os.urandom), so games
+# don't share the module-level generator
+_lobby_rngs: Dict[str, random.Random] = {}
+
+def _rng(lobby_name: str) -> random.Random:
+    """Get (or create) the random generator for a lobby's current game."""
+    rng = _lobby_rngs.get(lobby_name)
+    if rng is None:
+        rng = _lobby_rngs[lobby_name] = random.Random()
+    return rng
+
+# Running game loop per lobby. Holding the task keeps it from being
+# garbage collected mid-game and lets lobby deletion cancel it.
+_lobby_tasks: Dict[str, asyncio.Task] = {}
+
+def _spawn_game_loop(lobby_name: str, coro):
+    """Run a lobby's game loop as a task tracked in _lobby_tasks."""
+    task = asyncio.get_running_loop().create_task(coro)
+    _lobby_tasks[lobby_name] = task
+    
+    def _forget(done: asyncio.Task):
+        if _lobby_tasks.get(lobby_name) is done:
+            del _lobby_tasks[lobby_name]
+    
+    task.add_done_callback(_forget)
+
+async def _stop_game_loop(lobby_name: str):
+    """Cancel a lobby's game loop task, if one is running, and wait for it."""
+    task = _lobby_tasks.pop(lobby_name, None)
+    # The loop itself can end up here (a failed send disconnects the last
+    # player), and a task can't wait for itself
+    if task and task is not asyncio.current_task():
+        task.cancel()
+        await asyncio.wait([task])
+
+async def cancel_game(lobby_name: str):
+    """Stop a lobby's game loop (if running) and drop its runtime state."""
+    await _stop_game_loop(lobby_name)
+    _discard_runtime(lobby_name)
+
+def _discard_runtime(lobby_name: str):
+    """Drop all per-lobby in-memory game state once a game is over."""
+    _active_lobbies.pop(lobby_name, None)
+    _dirty_lobbies.discard(lobby_name)
+    _buzz_events.pop(lobby_name, None)
+    _all_buzzed_events.pop(lobby_name, None)
+    _buzzed_players.pop(lobby_name, None)
+    _pacing_events.pop(lobby_name, None)
+    _question_decks.pop(lobby_name, None)
+    _cancel_live_buzzers(lobby_name)
+    prefetch = _ai_prefetch.pop(lobby_name, None)
+    if prefetch:
+        prefetch[1].cancel()
+    _lobby_rngs.pop(lobby_name, None)
+
+async def _save_lobby(lobby_name: str, lobby: Lobby):
+    """Write a lobby to storage now, which also covers any pending dirty mark."""
+    _dirty_lobbies.discard(lobby_name)
+    storage = get_storage_sync()
+    await storage.set_lobby(lobby_name, lobby)
+
+async def _flush_lobby(lobby_name: str):
+    """Persist an active lobby if it changed since the last flush."""
+    if lobby_name in _dirty_lobbies:
+        lobby = _active_lobbies.get(lobby_name)
+        if lobby:
+            await _save_lobby(lobby_name, lobby)
+        else:
+            _dirty_lobbies.discard(lobby_name)
+
+async def _broadcast_with_host_followup(lobby_name: str, host: str, event: WSEvent, host_event: WSEvent, manager):
+    """Broadcast `event`, then send `host_event` to the host only.
+
+    The host gets both in order on its own, while the other players' copy
+    goes out concurrently instead of waiting for the broadcast to finish.
+    """
+    async def send_to_host():
+        await manager.send_to_player(lobby_name, host, event)
+        await manager.send_to_player(lobby_name, host, host_event)
+    
+    await asyncio.gather(
+        manager.broadcast_to_lobby(lobby_name, event, exclude_player=host),
+        send_to_host(),
+    )
+
+async def _pause(lobby_name: str, seconds: float):
+    """Pause between game phases; the host can skip ahead with next_question."""
+    event = _pacing_events[lobby_name] = asyncio.Event()
+    try:
+        await asyncio.wait_for(event.wait(), seconds)
+    except TimeoutError:
+        pass
+    finally:
+        if _pacing_events.get(lobby_name) is event:
+            del _pacing_events[lobby_name]
+
+def _rank_players(lobby: Lobby, points: Dict[str, int]) -> List[PlayerScore]:
+    """Score every player, highest first, with 1-based positions (ties keep join order)."""
+    ranked = sorted(lobby.players, key=lambda player: points.get(player.name, 0), reverse=True)
+    return [
+        PlayerScore(player_name=player.name, score=points.get(player.name, 0), position=position)
+        for position, player in enumerate(ranked, 1)
+    ]
+
+async def _sleep_until(deadline: float):
+    """Sleep until the loop clock reaches `deadline`.
+
+    Countdowns schedule against a fixed deadline (loop.time() is monotonic),
+    so time spent broadcasting a tick doesn't push the later ticks back.
+    """
+    await asyncio.sleep(max(0, deadline - asyncio.get_running_loop().time()))
+
+async def _wait_until(event: asyncio.Event, deadline: float) -> bool:
+    """Like _sleep_until, but return early (True) once `event` is set."""
+    try:
+        await asyncio.wait_for(event.wait(), max(0, deadline - asyncio.get_running_loop().time()))
+    except TimeoutError:
+        pass
+    return event.is_set()
 
 async def start_tap_gauntlet(lobby_name: str, lobby: Lobby, manager) -> bool:
     """Start a Tap Gauntlet game."""
@@ -17,19 +176,21 @@ async def start_tap_gauntlet(lobby_name: str, lobby: Lobby, manager) -> bool:
         return False
     
     # Initialize game data
+    now = time.time()
     game_data = TapGauntletData(
         state=GameState.STARTING,
-        start_time=time.time(),
+        start_time=now,
         player_taps={player.name: 0 for player in lobby.players},
         last_tap_times={player.name: 0 for player in lobby.players},
-        server_prompts={player.name: [] for player in lobby.players}
+        server_prompts={}
     )
     
     lobby.current_game = game_data
     lobby.game_state = GameState.STARTING
     
-    storage = await get_storage()
+    storage = get_storage_sync()
     await storage.set_lobby(lobby_name, lobby)
+    _active_lobbies[lobby_name] = lobby
     
     # Broadcast game start
     await manager.broadcast_to_lobby(lobby_name, WSEvent(
@@ -39,34 +200,29 @@ async def start_tap_gauntlet(lobby_name: str, lobby: Lobby, manager) -> bool:
             "duration": game_data.duration_seconds,
             "countdown": 3
         },
-        timestamp=time.time()
+        timestamp=now
     ))
     
     # Start countdown and game loop
-    asyncio.create_task(_run_tap_gauntlet_game(lobby_name, manager))
+    _spawn_game_loop(lobby_name, _run_tap_gauntlet_game(lobby_name, manager))
     return True
 
 async def _run_tap_gauntlet_game(lobby_name: str, manager):
     """Run the Tap Gauntlet game loop."""
-    storage = await get_storage()
+    storage = get_storage_sync()
     
-    # 3-second countdown
-    for i in range(3, 0, -1):
-        await manager.broadcast_to_lobby(lobby_name, WSEvent(
-            type=WSEventType.TICK,
-            payload={"countdown": i, "message": f"Starting in {i}..."},
-            timestamp=time.time()
-        ))
-        await asyncio.sleep(1)
+    # 3-second countdown: game_started announced it, clients count it down
+    await asyncio.sleep(3)
     
-    # Start game
-    lobby = await storage.get_lobby(lobby_name)
+    # Start game (on the in-memory lobby the tap handlers mutate)
+    lobby = _active_lobbies.get(lobby_name)
     if not lobby or not isinstance(lobby.current_game, TapGauntletData):
+        _discard_runtime(lobby_name)
         return
     
     game_data = lobby.current_game
     game_data.state = GameState.IN_PROGRESS
-    game_data.start_time = time.time()
+    game_data.start_time = start_time = time.time()
     lobby.game_state = GameState.IN_PROGRESS
     
     await storage.set_lobby(lobby_name, lobby)
@@ -79,108 +235,112 @@ async def _run_tap_gauntlet_game(lobby_name: str, manager):
             "game_time": 0,
             "remaining_time": game_data.duration_seconds
         },
-        timestamp=time.time()
+        timestamp=start_time
     ))
     
-    # Game loop with anti-cheat prompts
+    # Game loop with anti-cheat prompts. Everything happens on the 500ms
+    # ticks, so prompts ride on every 4th tick instead of needing their
+    # own timer and wake-ups.
     game_duration = game_data.duration_seconds
     tick_interval = 0.5  # Send updates every 500ms
-    anti_cheat_interval = 2.0  # Send validation prompts every 2 seconds
+    anti_cheat_every = 4  # Ticks between validation prompts (every 2 seconds)
+    full_scores_every = 5  # Ticks between full score snapshots; the rest carry only changes
+    
+    sent_scores: Dict[str, int] = {}
+    tick = 0
+    tick_base = asyncio.get_running_loop().time()
     
-    start_time = time.time()
-    last_anti_cheat = start_time
+    # Bound once; the loop runs at 2 Hz for the whole game
+    clock = time.time
+    sleep_until = _sleep_until
+    broadcast = manager.broadcast_to_lobby
+    # Taps mutate this same dict, so ticks read it without a storage fetch
+    player_taps = game_data.player_taps
     
     while True:
-        current_time = time.time()
+        current_time = clock()
         elapsed = current_time - start_time
-        remaining = max(0, game_duration - elapsed)
+        remaining = game_duration - elapsed
         
         if remaining <= 0:
             break
         
         # Send anti-cheat prompts
-        if current_time - last_anti_cheat >= anti_cheat_interval:
-            await _send_anti_cheat_prompts(lobby_name, manager)
-            last_anti_cheat = current_time
+        if tick and tick % anti_cheat_every == 0:
+            await _send_anti_cheat_prompts(lobby_name, manager, current_time)
         
-        # Send tick update
-        lobby = await storage.get_lobby(lobby_name)
-        if lobby and isinstance(lobby.current_game, TapGauntletData):
-            await manager.broadcast_to_lobby(lobby_name, WSEvent(
-                type=WSEventType.TICK,
-                payload={
-                    "game_time": elapsed,
-                    "remaining_time": remaining,
-                    "scores": lobby.current_game.player_taps
-                },
-                timestamp=current_time
-            ))
+        payload = {"game_time": elapsed, "remaining_time": remaining}
+        if tick % full_scores_every == 0:
+            # Persist taps on the same coarse interval; the end of the game
+            # writes the final counts regardless
+            await _flush_lobby(lobby_name)
+            # Periodic full snapshot so clients that missed a delta resync
+            payload["scores"] = player_taps
+            sent_scores = dict(player_taps)
+        else:
+            delta = {name: taps for name, taps in player_taps.items() if sent_scores.get(name) != taps}
+            if delta:
+                payload["scores_delta"] = delta
+                sent_scores.update(delta)
+        await broadcast(lobby_name, WSEvent(
+            type=WSEventType.TICK,
+            payload=payload,
+            timestamp=current_time
+        ))
         
-        await asyncio.sleep(tick_interval)
+        tick += 1
+        # Against fixed deadlines, so send time doesn't stretch the game
+        await sleep_until(tick_base + tick * tick_interval)
     
     # End game
     await _end_tap_gauntlet_game(lobby_name, manager)
 
-async def _send_anti_cheat_prompts(lobby_name: str, manager):
+async def _send_anti_cheat_prompts(lobby_name: str, manager, current_time: float):
     """Send random prompts to players for anti-cheat validation."""
-    storage = await get_storage()
-    lobby = await storage.get_lobby(lobby_name)
+    lobby = _active_lobbies.get(lobby_name)
     
     if not lobby or not isinstance(lobby.current_game, TapGauntletData):
         return
     
     game_data = lobby.current_game
-    prompt_id = str(random.randint(1000, 9999))
-    current_time = time.time()
+    rng = _rng(lobby_name)
+    prompt_id = str(rng.randint(1000, 9999))
     
     # Randomly select 1-2 players for validation
-    players_to_prompt = random.sample(
+    players_to_prompt = rng.sample(
         [p.name for p in lobby.players], 
         min(2, len(lobby.players))
     )
     
     for player_name in players_to_prompt:
-        if player_name not in game_data.server_prompts:
-            game_data.server_prompts[player_name] = []
-        game_data.server_prompts[player_name].append(current_time)
-        
-        await manager.send_to_player(lobby_name, player_name, WSEvent(
-            type=WSEventType.GAME_STATE,
-            payload={
-                "anti_cheat_prompt": prompt_id,
-                "timestamp": current_time
-            },
-            timestamp=current_time
-        ))
+        game_data.server_prompts[player_name] = current_time
+    _dirty_lobbies.add(lobby_name)
     
-    await storage.set_lobby(lobby_name, lobby)
+    # Same prompt for everyone selected: encode it once, send concurrently
+    await manager.broadcast_to_lobby(lobby_name, WSEvent(
+        type=WSEventType.GAME_STATE,
+        payload={
+            "anti_cheat_prompt": prompt_id,
+            "timestamp": current_time
+        },
+        timestamp=current_time
+    ), only_players=players_to_prompt)
 
 async def _end_tap_gauntlet_game(lobby_name: str, manager):
     """End the Tap Gauntlet game and calculate results."""
-    storage = await get_storage()
-    lobby = await storage.get_lobby(lobby_name)
+    # Stop serving taps from the in-memory copy; the final state is saved below
+    lobby = _active_lobbies.get(lobby_name)
+    _discard_runtime(lobby_name)
     
     if not lobby or not isinstance(lobby.current_game, TapGauntletData):
         return
     
     game_data = lobby.current_game
     game_data.state = GameState.FINISHED
-    game_data.end_time = time.time()
+    game_data.end_time = now = time.time()
     
     # Calculate results
-    scores = []
-    for player in lobby.players:
-        taps = game_data.player_taps.get(player.name, 0)
-        scores.append(PlayerScore(
-            player_name=player.name,
-            score=taps,
-            position=0  # Will be set after sorting
-        ))
-    
-    # Sort by score descending
-    scores.sort(key=lambda x: x.score, reverse=True)
-    for i, score in enumerate(scores):
-        score.position = i + 1
+    scores = _rank_players(lobby, game_data.player_taps)
     
     # Determine winner
     winner = scores[0].player_name if scores else None
@@ -200,19 +360,19 @@ async def _end_tap_gauntlet_game(lobby_name: str, manager):
     for player in lobby.players:
         player.is_ready = False
     
+    storage = get_storage_sync()
     await storage.set_lobby(lobby_name, lobby)
     
     # Broadcast results
     await manager.broadcast_to_lobby(lobby_name, WSEvent(
         type=WSEventType.GAME_FINISHED,
-        payload={"results": results.model_dump()},
-        timestamp=time.time()
+        payload={"results": results},
+        timestamp=now
     ))
 
 async def handle_tap_gauntlet_action(lobby_name: str, player_name: str, action: str, payload: dict, manager):
     """Handle Tap Gauntlet specific actions."""
-    storage = await get_storage()
-    lobby = await storage.get_lobby(lobby_name)
+    lobby = _active_lobbies.get(lobby_name)
     
     if not lobby or not isinstance(lobby.current_game, TapGauntletData):
         return
@@ -222,24 +382,16 @@ async def handle_tap_gauntlet_action(lobby_name: str, player_name: str, action:
     if game_data.state != GameState.IN_PROGRESS:
         return
     
-    current_time = time.time()
-    
     if action == "tap":
-        await _handle_tap_action(lobby_name, player_name, current_time, manager)
+        # The rate limit only compares taps with each other, so it runs on
+        # the monotonic clock and can't be thrown off by wall-clock steps
+        await _handle_tap_action(lobby_name, player_name, game_data, time.monotonic(), manager)
     elif action == "tap_response":
         prompt_id = payload.get("prompt_id")
-        await _handle_tap_response(lobby_name, player_name, prompt_id, current_time, manager)
+        await _handle_tap_response(lobby_name, player_name, game_data, prompt_id, time.time(), manager)
 
-async def _handle_tap_action(lobby_name: str, player_name: str, tap_time: float, manager):
+async def _handle_tap_action(lobby_name: str, player_name: str, game_data: TapGauntletData, tap_time: float, manager):
     """Handle a tap action with anti-cheat validation."""
-    storage = await get_storage()
-    lobby = await storage.get_lobby(lobby_name)
-    
-    if not lobby or not isinstance(lobby.current_game, TapGauntletData):
-        return
-    
-    game_data = lobby.current_game
-    
     # Anti-cheat: Check tap rate
     last_tap = game_data.last_tap_times.get(player_name, 0)
     time_since_last = tap_time - last_tap
@@ -251,50 +403,26 @@ async def _handle_tap_action(lobby_name: str, player_name: str, tap_time: float,
     # Update tap count and timestamp
     game_data.player_taps[player_name] = game_data.player_taps.get(player_name, 0) + 1
     game_data.last_tap_times[player_name] = tap_time
-    
-    await storage.set_lobby(lobby_name, lobby)
-    
-    # Send immediate feedback to player
-    await manager.send_to_player(lobby_name, player_name, WSEvent(
-        type=WSEventType.GAME_STATE,
-        payload={
-            "tap_confirmed": True,
-            "current_taps": game_data.player_taps[player_name]
-        },
-        timestamp=tap_time
-    ))
+    _dirty_lobbies.add(lobby_name)
+    # No per-tap ACK: the client counts optimistically and the 500ms tick's
+    # scores correct it
 
-async def _handle_tap_response(lobby_name: str, player_name: str, prompt_id: str, response_time: float, manager):
+async def _handle_tap_response(lobby_name: str, player_name: str, game_data: TapGauntletData, prompt_id: str, response_time: float, manager):
     """Handle anti-cheat prompt response."""
-    storage = await get_storage()
-    lobby = await storage.get_lobby(lobby_name)
-    
-    if not lobby or not isinstance(lobby.current_game, TapGauntletData):
-        return
-    
-    game_data = lobby.current_game
-    
-    # Validate response timing (should be quick for legitimate players)
-    player_prompts = game_data.server_prompts.get(player_name, [])
-    
-    # Find the most recent prompt within reasonable time window
-    valid_response = False
-    for prompt_time in reversed(player_prompts):
-        if response_time - prompt_time < 2.0:  # 2 second window
-            valid_response = True
-            break
+    # Validate response timing (should be quick for legitimate players).
+    # Only the latest prompt can be within the window: they're 2s apart.
+    prompt_time = game_data.server_prompts.get(player_name)
+    valid_response = prompt_time is not None and response_time - prompt_time < 2.0  # 2 second window
     
     if not valid_response:
         # Potential cheating - could reduce tap count or flag player
         # For now, we'll just log it
-        print(f"Suspicious activity from {player_name}: invalid prompt response")
-    
-    await storage.set_lobby(lobby_name, lobby)
+        logger.warning("Suspicious activity from %s: invalid prompt response", player_name)
 
 # ===== BUZZER TRIVIA GAME =====
 
 # Trivia Categories
-TRIVIA_CATEGORIES = [
+TRIVIA_CATEGORIES = (
     "Music & Pop Culture",
     "Movies & TV",
     "Sports",
@@ -302,143 +430,230 @@ TRIVIA_CATEGORIES = [
     "Science & Medical",
     "Animals",
     "Geography"
-]
+)
 
-# Trivia Questions Bank
+# Trivia Questions Bank: category -> ((question, answer), ...)
 TRIVIA_QUESTIONS = {
-    "Music & Pop Culture": [
-        {"question": "Who sang 'Margaritaville' in 1977?", "answer": "Jimmy Buffett"},
-        {"question": "Which Beatle was the first to release a solo album?", "answer": "George Harrison"},
-        {"question": "In what year did MTV first go on the air?", "answer": "1981"},
-        {"question": "What was Elvis Presley's middle name?", "answer": "Aaron"},
-        {"question": "Who was the original host of American Bandstand?", "answer": "Bob Horn"},
-        {"question": "Who was the lead singer of The Doors?", "answer": "Jim Morrison"},
-        {"question": "Which pop star sang 'Like a Virgin' in 1984?", "answer": "Madonna"},
-        {"question": "What year did the Woodstock music festival take place?", "answer": "1969"},
-        {"question": "Who was known as the 'Man in Black'?", "answer": "Johnny Cash"},
-        {"question": "What was the first music video played on MTV?", "answer": "Video Killed the Radio Star by The Buggles"},
-        {"question": "What was the first album to sell over 30 million copies worldwide?", "answer": "Thriller by Michael Jackson"},
-        {"question": "Who wrote the song 'Me and Bobby McGee'?", "answer": "Kris Kristofferson"},
-        {"question": "Which guitarist was nicknamed 'Slowhand'?", "answer": "Eric Clapton"},
-        {"question": "What city was the original Motown headquarters located in?", "answer": "Detroit, Michigan"},
-        {"question": "Who was the first woman inducted into the Rock & Roll Hall of Fame?", "answer": "Aretha Franklin"},
-    ],
-    "Movies & TV": [
-        {"question": "In Cheers, what was the name of the bar's know-it-all mailman?", "answer": "Cliff Clavin"},
-        {"question": "Who played Dirty Harry in the 1971 film?", "answer": "Clint Eastwood"},
-        {"question": "What movie won the first-ever Academy Award for Best Picture?", "answer": "Wings"},
-        {"question": "In The Golden Girls, which character was from St. Olaf, Minnesota?", "answer": "Rose Nylund"},
-        {"question": "Who shot J.R. in Dallas?", "answer": "Kristin Shepard"},
-        {"question": "What 1975 movie is credited with creating the concept of the 'summer blockbuster'?", "answer": "Jaws"},
-        {"question": "Who played Rocky Balboa's trainer, Mickey, in the Rocky films?", "answer": "Burgess Meredith"},
-        {"question": "In I Love Lucy, what was Lucy's husband's first name?", "answer": "Ricky"},
-        {"question": "Which actor voiced Darth Vader in the original Star Wars trilogy?", "answer": "James Earl Jones"},
-        {"question": "What TV show featured the catchphrase 'Book 'em, Danno'?", "answer": "Hawaii Five-O"},
-        {"question": "What was the name of Quint's boat in Jaws?", "answer": "The Orca"},
-        {"question": "In the original Twilight Zone series, who was the show's creator and narrator?", "answer": "Rod Serling"},
-        {"question": "Which 1970s sci-fi film features the ship 'Discovery One'?", "answer": "2001: A Space Odyssey"},
-        {"question": "In The Godfather, who wakes up with a horse's head in his bed?", "answer": "Jack Woltz"},
-        {"question": "What actor turned down the role of Han Solo before Harrison Ford got it?", "answer": "Al Pacino"},
-    ],
-    "Sports": [
-        {"question": "Who holds the MLB record for most career home runs?", "answer": "Barry Bonds"},
-        {"question": "What NFL team won the first Super Bowl in 1967?", "answer": "Green Bay Packers"},
-        {"question": "Who was known as 'The Greatest' in boxing?", "answer": "Muhammad Ali"},
-        {"question": "In golf, what's the term for three under par on a single hole?", "answer": "Albatross"},
-        {"question": "Which NHL team has the most Stanley Cup wins?", "answer": "Montreal Canadiens"},
-        {"question": "Who was the first NBA player to score 100 points in a single game?", "answer": "Wilt Chamberlain"},
-        {"question": "Which country won the FIFA World Cup in 1982?", "answer": "Italy"},
-        {"question": "In baseball, what is the term for hitting a home run with the bases loaded?", "answer": "Grand slam"},
-        {"question": "Who was the first woman to run the Boston Marathon officially?", "answer": "Kathrine Switzer"},
-        {"question": "What horse won the Triple Crown in 1973?", "answer": "Secretariat"},
-        {"question": "Who was the first baseball player to have his number retired?", "answer": "Lou Gehrig"},
-        {"question": "Which country won the first-ever FIFA Women's World Cup in 1991?", "answer": "United States"},
-        {"question": "In what year did the NHL officially merge with the WHA?", "answer": "1979"},
-        {"question": "What was the last MLB team to integrate racially?", "answer": "Boston Red Sox"},
-        {"question": "Who was the first NBA player drafted number one straight out of high school?", "answer": "Kwame Brown"},
-    ],
-    "General Knowledge": [
-        {"question": "What's the capital of Canada?", "answer": "Ottawa"},
-        {"question": "Who invented the telephone?", "answer": "Alexander Graham Bell"},
-        {"question": "How many sides does a stop sign have?", "answer": "Eight"},
-        {"question": "What's the world's largest ocean?", "answer": "Pacific Ocean"},
-        {"question": "Which U.S. president appears on the $2 bill?", "answer": "Thomas Jefferson"},
-        {"question": "What is the smallest U.S. state by land area?", "answer": "Rhode Island"},
-        {"question": "Who painted the ceiling of the Sistine Chapel?", "answer": "Michelangelo"},
-        {"question": "What's the chemical symbol for gold?", "answer": "Au"},
-        {"question": "What is the largest desert in the world?", "answer": "Antarctic Desert"},
-        {"question": "What was the first U.S. state?", "answer": "Delaware"},
-        {"question": "What year did the Berlin Wall fall?", "answer": "1989"},
-        {"question": "Who invented the lightbulb?", "answer": "Thomas Edison"},
-        {"question": "What's the only country in the world named after a woman?", "answer": "Saint Lucia"},
-        {"question": "What U.S. state has the most ghost towns?", "answer": "Texas"},
-        {"question": "What's the rarest M&M color?", "answer": "Brown"},
-    ],
-    "Science & Medical": [
-        {"question": "What is the largest internal organ in the human body?", "answer": "Liver"},
-        {"question": "How many chambers are in the human heart?", "answer": "Four"},
-        {"question": "What is the medical term for the kneecap?", "answer": "Patella"},
-        {"question": "Which part of the brain controls balance and coordination?", "answer": "Cerebellum"},
-        {"question": "What is the longest bone in the human body?", "answer": "Femur"},
-        {"question": "What disease is caused by a deficiency of vitamin D?", "answer": "Rickets"},
-        {"question": "What is the medical term for high blood pressure?", "answer": "Hypertension"},
-        {"question": "Which viral disease has been completely eradicated worldwide?", "answer": "Smallpox"},
-        {"question": "What is the medical term for a heart attack?", "answer": "Myocardial infarction"},
-        {"question": "What condition is known as 'the bends'?", "answer": "Decompression sickness"},
-        {"question": "Who is known as the 'Father of Medicine'?", "answer": "Hippocrates"},
-        {"question": "In what year was penicillin discovered?", "answer": "1928"},
-        {"question": "Who invented the first practical stethoscope?", "answer": "René Laennec"},
-        {"question": "What was the first vaccine ever developed?", "answer": "Smallpox vaccine"},
-        {"question": "What part of the human body can regenerate itself?", "answer": "Liver"},
-    ],
-    "Animals": [
-        {"question": "What is the largest mammal in the world?", "answer": "Blue Whale"},
-        {"question": "How many hearts does an octopus have?", "answer": "3"},
-        {"question": "What is a group of lions called?", "answer": "Pride"},
-        {"question": "Which animal is known as the 'Ship of the Desert'?", "answer": "Camel"},
-        {"question": "How many legs does a spider have?", "answer": "8"},
-        {"question": "What is the fastest land animal?", "answer": "Cheetah"},
-        {"question": "Which bird cannot fly but is the fastest runner?", "answer": "Ostrich"},
-        {"question": "What do you call a baby kangaroo?", "answer": "Joey"},
-        {"question": "Which animal has the longest lifespan?", "answer": "Tortoise"},
-        {"question": "What is the largest type of penguin?", "answer": "Emperor penguin"},
-        {"question": "Which animal has the longest migration route?", "answer": "Arctic tern"},
-        {"question": "What's the only venomous lizard native to the United States?", "answer": "Gila monster"},
-        {"question": "Which mammal can survive the longest without drinking water?", "answer": "Kangaroo rat"},
-        {"question": "What is the largest living bird by weight?", "answer": "Ostrich"},
-        {"question": "Which animal has the most powerful bite force in the animal kingdom?", "answer": "Saltwater crocodile"},
-    ],
-    "Geography": [
-        {"question": "What is the capital of Australia?", "answer": "Canberra"},
-        {"question": "Which river is the longest in the world?", "answer": "Nile"},
-        {"question": "How many continents are there?", "answer": "7"},
-        {"question": "Which is the smallest country in the world?", "answer": "Vatican City"},
-        {"question": "What is the tallest mountain in the world?", "answer": "Mount Everest"},
-        {"question": "Which desert is the largest in the world?", "answer": "Antarctica"},
-        {"question": "What is the deepest ocean trench?", "answer": "Mariana Trench"},
-        {"question": "Which country has the most time zones?", "answer": "France"},
-        {"question": "What is the longest river in South America?", "answer": "Amazon River"},
-        {"question": "Which African country is completely surrounded by South Africa?", "answer": "Lesotho"},
-        {"question": "Which country has the most lakes in the world?", "answer": "Canada"},
-        {"question": "What is the capital of Kazakhstan?", "answer": "Astana"},
-        {"question": "Which European capital city is built on 14 islands?", "answer": "Stockholm"},
-        {"question": "Which African country has the largest population?", "answer": "Nigeria"},
-        {"question": "What is the deepest point in the world's oceans?", "answer": "Mariana Trench"},
-    ]
+    "Music & Pop Culture": (
+        ("Who sang 'Margaritaville' in 1977?", "Jimmy Buffett"),
+        ("Which Beatle was the first to release a solo album?", "George Harrison"),
+        ("In what year did MTV first go on the air?", "1981"),
+        ("What was Elvis Presley's middle name?", "Aaron"),
+        ("Who was the original host of American Bandstand?", "Bob Horn"),
+        ("Who was the lead singer of The Doors?", "Jim Morrison"),
+        ("Which pop star sang 'Like a Virgin' in 1984?", "Madonna"),
+        ("What year did the Woodstock music festival take place?", "1969"),
+        ("Who was known as the 'Man in Black'?", "Johnny Cash"),
+        ("What was the first music video played on MTV?", "Video Killed the Radio Star by The Buggles"),
+        ("What was the first album to sell over 30 million copies worldwide?", "Thriller by Michael Jackson"),
+        ("Who wrote the song 'Me and Bobby McGee'?", "Kris Kristofferson"),
+        ("Which guitarist was nicknamed 'Slowhand'?", "Eric Clapton"),
+        ("What city was the original Motown headquarters located in?", "Detroit, Michigan"),
+        ("Who was the first woman inducted into the Rock & Roll Hall of Fame?", "Aretha Franklin"),
+    ),
+    "Movies & TV": (
+        ("In Cheers, what was the name of the bar's know-it-all mailman?", "Cliff Clavin"),
+        ("Who played Dirty Harry in the 1971 film?", "Clint Eastwood"),
+        ("What movie won the first-ever Academy Award for Best Picture?", "Wings"),
+        ("In The Golden Girls, which character was from St. Olaf, Minnesota?", "Rose Nylund"),
+        ("Who shot J.R. in Dallas?", "Kristin Shepard"),
+        ("What 1975 movie is credited with creating the concept of the 'summer blockbuster'?", "Jaws"),
+        ("Who played Rocky Balboa's trainer, Mickey, in the Rocky films?", "Burgess Meredith"),
+        ("In I Love Lucy, what was Lucy's husband's first name?", "Ricky"),
+        ("Which actor voiced Darth Vader in the original Star Wars trilogy?", "James Earl Jones"),
+        ("What TV show featured the catchphrase 'Book 'em, Danno'?", "Hawaii Five-O"),
+        ("What was the name of Quint's boat in Jaws?", "The Orca"),
+        ("In the original Twilight Zone series, who was the show's creator and narrator?", "Rod Serling"),
+        ("Which 1970s sci-fi film features the ship 'Discovery One'?", "2001: A Space Odyssey"),
+        ("In The Godfather, who wakes up with a horse's head in his bed?", "Jack Woltz"),
+        ("What actor turned down the role of Han Solo before Harrison Ford got it?", "Al Pacino"),
+    ),
+    "Sports": (
+        ("Who holds the MLB record for most career home runs?", "Barry Bonds"),
+        ("What NFL team won the first Super Bowl in 1967?", "Green Bay Packers"),
+        ("Who was known as 'The Greatest' in boxing?", "Muhammad Ali"),
+        ("In golf, what's the term for three under par on a single hole?", "Albatross"),
+        ("Which NHL team has the most Stanley Cup wins?", "Montreal Canadiens"),
+        ("Who was the first NBA player to score 100 points in a single game?", "Wilt Chamberlain"),
+        ("Which country won the FIFA World Cup in 1982?", "Italy"),
+        ("In baseball, what is the term for hitting a home run with the bases loaded?", "Grand slam"),
+        ("Who was the first woman to run the Boston Marathon officially?", "Kathrine Switzer"),
+        ("What horse won the Triple Crown in 1973?", "Secretariat"),
+        ("Who was the first baseball player to have his number retired?", "Lou Gehrig"),
+        ("Which country won the first-ever FIFA Women's World Cup in 1991?", "United States"),
+        ("In what year did the NHL officially merge with the WHA?", "1979"),
+        ("What was the last MLB team to integrate racially?", "Boston Red Sox"),
+        ("Who was the first NBA player drafted number one straight out of high school?", "Kwame Brown"),
+    ),
+    "General Knowledge": (
+        ("What's the capital of Canada?", "Ottawa"),
+        ("Who invented the telephone?", "Alexander Graham Bell"),
+        ("How many sides does a stop sign have?", "Eight"),
+        ("What's the world's largest ocean?", "Pacific Ocean"),
+        ("Which U.S. president appears on the $2 bill?", "Thomas Jefferson"),
+        ("What is the smallest U.S. state by land area?", "Rhode Island"),
+        ("Who painted the ceiling of the Sistine Chapel?", "Michelangelo"),
+        ("What's the chemical symbol for gold?", "Au"),
+        ("What is the largest desert in the world?", "Antarctic Desert"),
+        ("What was the first U.S. state?", "Delaware"),
+        ("What year did the Berlin Wall fall?", "1989"),
+        ("Who invented the lightbulb?", "Thomas Edison"),
+        ("What's the only country in the world named after a woman?", "Saint Lucia"),
+        ("What U.S. state has the most ghost towns?", "Texas"),
+        ("What's the rarest M&M color?", "Brown"),
+    ),
+    "Science & Medical": (
+        ("What is the largest internal organ in the human body?", "Liver"),
+        ("How many chambers are in the human heart?", "Four"),
+        ("What is the medical term for the kneecap?", "Patella"),
+        ("Which part of the brain controls balance and coordination?", "Cerebellum"),
+        ("What is the longest bone in the human body?", "Femur"),
+        ("What disease is caused by a deficiency of vitamin D?", "Rickets"),
+        ("What is the medical term for high blood pressure?", "Hypertension"),
+        ("Which viral disease has been completely eradicated worldwide?", "Smallpox"),
+        ("What is the medical term for a heart attack?", "Myocardial infarction"),
+        ("What condition is known as 'the bends'?", "Decompression sickness"),
+        ("Who is known as the 'Father of Medicine'?", "Hippocrates"),
+        ("In what year was penicillin discovered?", "1928"),
+        ("Who invented the first practical stethoscope?", "René Laennec"),
+        ("What was the first vaccine ever developed?", "Smallpox vaccine"),
+        ("What part of the human body can regenerate itself?", "Liver"),
+    ),
+    "Animals": (
+        ("What is the largest mammal in the world?", "Blue Whale"),
+        ("How many hearts does an octopus have?", "3"),
+        ("What is a group of lions called?", "Pride"),
+        ("Which animal is known as the 'Ship of the Desert'?", "Camel"),
+        ("How many legs does a spider have?", "8"),
+        ("What is the fastest land animal?", "Cheetah"),
+        ("Which bird cannot fly but is the fastest runner?", "Ostrich"),
+        ("What do you call a baby kangaroo?", "Joey"),
+        ("Which animal has the longest lifespan?", "Tortoise"),
+        ("What is the largest type of penguin?", "Emperor penguin"),
+        ("Which animal has the longest migration route?", "Arctic tern"),
+        ("What's the only venomous lizard native to the United States?", "Gila monster"),
+        ("Which mammal can survive the longest without drinking water?", "Kangaroo rat"),
+        ("What is the largest living bird by weight?", "Ostrich"),
+        ("Which animal has the most powerful bite force in the animal kingdom?", "Saltwater crocodile"),
+    ),
+    "Geography": (
+        ("What is the capital of Australia?", "Canberra"),
+        ("Which river is the longest in the world?", "Nile"),
+        ("How many continents are there?", "7"),
+        ("Which is the smallest country in the world?", "Vatican City"),
+        ("What is the tallest mountain in the world?", "Mount Everest"),
+        ("Which desert is the largest in the world?", "Antarctica"),
+        ("What is the deepest ocean trench?", "Mariana Trench"),
+        ("Which country has the most time zones?", "France"),
+        ("What is the longest river in South America?", "Amazon River"),
+        ("Which African country is completely surrounded by South Africa?", "Lesotho"),
+        ("Which country has the most lakes in the world?", "Canada"),
+        ("What is the capital of Kazakhstan?", "Astana"),
+        ("Which European capital city is built on 14 islands?", "Stockholm"),
+        ("Which African country has the largest population?", "Nigeria"),
+        ("What is the deepest point in the world's oceans?", "Mariana Trench"),
+    )
 }
 
+def _draw_question(lobby_name: str, category: str) -> Optional[Tuple[str, str]]:
+    """Take the next (question, answer) from the lobby's shuffled deck."""
+    deck = _question_decks.get(lobby_name)
+    if not deck:
+        questions = TRIVIA_QUESTIONS.get(category)
+        if not questions:
+            return None
+        # New category or every question used: (re)shuffle the whole bank
+        deck = _question_decks[lobby_name] = list(questions)
+        _rng(lobby_name).shuffle(deck)
+    return deck.pop()
+
+def _queue_live_buzzers(lobby_name: str, game_data: BuzzerTriviaData, manager):
+    """Schedule a live_buzzers broadcast unless one is already pending.
+
+    Called right after a buzz is appended; the broadcast starts at that
+    entry, since everything before it went out in earlier broadcasts.
+    """
+    if lobby_name not in _live_buzzer_flushes:
+        _live_buzzer_flushes[lobby_name] = asyncio.get_running_loop().create_task(
+            _flush_live_buzzers(lobby_name, game_data, len(game_data.buzzers) - 1, manager)
+        )
+
+def _cancel_live_buzzers(lobby_name: str):
+    """Drop a pending live_buzzers broadcast (the round is over)."""
+    flush = _live_buzzer_flushes.pop(lobby_name, None)
+    if flush:
+        flush.cancel()
+
+async def _flush_live_buzzers(lobby_name: str, game_data: BuzzerTriviaData, start: int, manager):
+    """Broadcast buzzers[start:] once the coalescing window has passed.
+
+    Clients already hold the earlier entries (or got them in the lobby
+    state sent on connect), so they splice the new ones in at `start`.
+    """
+    await asyncio.sleep(LIVE_BUZZERS_WINDOW)
+    # Unregister first: buzzes during the send below queue a fresh broadcast
+    _live_buzzer_flushes.pop(lobby_name, None)
+    buzzers = game_data.buzzers
+    if len(buzzers) <= start:
+        return
+    latest = buzzers[-1]["player"]
+    await manager.broadcast_to_lobby(lobby_name, WSEvent(
+        type=WSEventType.GAME_STATE,
+        payload={
+            "phase": "live_buzzers",
+            "buzzer_player": latest,
+            "added": buzzers[start:],
+            "start": start,
+            "count": len(buzzers),
+            "message": f"🔔 {latest} buzzed in! (#{len(buzzers)})",
+            "keep_buzzing": True  # Keep buzzers active
+        },
+        timestamp=time.time()
+    ))
+
+async def _next_ai_question(lobby_name: str, category: str) -> Optional[Dict[str, str]]:
+    """Get an AI question (prefetched if one is ready for this category).
+
+    Also starts fetching the one after, so a host who generates questions
+    doesn't wait on the API every time.
+    """
+    question = None
+    prefetch = _ai_prefetch.pop(lobby_name, None)
+    if prefetch:
+        prefetched_category, task = prefetch
+        if prefetched_category == category:
+            try:
+                question = await task
+            except Exception:
+                logger.exception("Prefetched AI question failed")
+        else:
+            task.cancel()
+    
+    if question is None:
+        question = await get_ai_question(category)
+    
+    # The game may have ended while we waited; don't fetch for a dead lobby
+    if chatgpt_generator.api_key and lobby_name in _active_lobbies:
+        task = asyncio.get_running_loop().create_task(get_ai_question(category))
+        # Retrieve the outcome even if the prefetch is never used, so a
+        # failed one doesn't log "Task exception was never retrieved"
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        _ai_prefetch[lobby_name] = (category, task)
+    return question
+
 async def start_buzzer_trivia(lobby_name: str, lobby: Lobby, manager) -> bool:
     """Start a Buzzer Trivia game."""
     if lobby.game_state != GameState.WAITING:
         return False
 
     # Pick 3 random categories for voting
-    selected_categories = random.sample(TRIVIA_CATEGORIES, 3)
+    selected_categories = _rng(lobby_name).sample(TRIVIA_CATEGORIES, 3)
 
     # Initialize game data
+    now = time.time()
     game_data = BuzzerTriviaData(
         state=GameState.STARTING,
-        start_time=time.time(),
+        start_time=now,
         category_options=selected_categories,
         total_scores={player.name: 0 for player in lobby.players}
     )
@@ -446,8 +661,9 @@ async def start_buzzer_trivia(lobby_name: str, lobby: Lobby, manager) -> bool:
     lobby.current_game = game_data
     lobby.game_state = GameState.STARTING
 
-    storage = await get_storage()
+    storage = get_storage_sync()
     await storage.set_lobby(lobby_name, lobby)
+    _active_lobbies[lobby_name] = lobby
 
     # Broadcast game start
     await manager.broadcast_to_lobby(lobby_name, WSEvent(
@@ -457,31 +673,24 @@ async def start_buzzer_trivia(lobby_name: str, lobby: Lobby, manager) -> bool:
             "message": "🔔 Buzzer Trivia! First, vote for a category!",
             "countdown": 3
         },
-        timestamp=time.time()
+        timestamp=now
     ))
 
     # Start game loop
-    asyncio.create_task(_run_buzzer_trivia_game(lobby_name, manager))
+    _spawn_game_loop(lobby_name, _run_buzzer_trivia_game(lobby_name, manager))
     return True
 
 async def _run_buzzer_trivia_game(lobby_name: str, manager):
     """Run the Buzzer Trivia game loop."""
-    # Simple 3 second countdown
-    for i in range(3, 0, -1):
-        await manager.broadcast_to_lobby(lobby_name, WSEvent(
-            type=WSEventType.TICK,
-            payload={"countdown": i, "message": f"Starting in {i}..."},
-            timestamp=time.time()
-        ))
-        await asyncio.sleep(1)
+    # Simple 3 second countdown, announced by game_started
+    await asyncio.sleep(3)
 
     # Start category voting
     await _start_category_voting(lobby_name, manager)
 
 async def _start_category_voting(lobby_name: str, manager):
     """Start the category voting phase."""
-    storage = await get_storage()
-    lobby = await storage.get_lobby(lobby_name)
+    lobby = _active_lobbies.get(lobby_name)
 
     if not lobby or not isinstance(lobby.current_game, BuzzerTriviaData):
         return
@@ -501,68 +710,62 @@ async def _start_category_voting(lobby_name: str, manager):
         timestamp=time.time()
     ))
 
-    # Wait 15 seconds for voting with live countdown
+    # Wait 15 seconds for voting with live countdown (one tick per second)
     voting_timeout = 15
-    start_time = time.time()
-    last_countdown = voting_timeout
+    voting_end = asyncio.get_running_loop().time() + voting_timeout
     
-    while time.time() - start_time < voting_timeout:
-        current_remaining = voting_timeout - int(time.time() - start_time)
-        
-        # Send countdown update when it changes
-        if current_remaining != last_countdown and current_remaining >= 0:
-            await manager.broadcast_to_lobby(lobby_name, WSEvent(
-                type=WSEventType.GAME_STATE,
-                payload={
-                    "phase": "voting_countdown",
-                    "countdown": current_remaining,
-                    "message": f"Vote for a category! {current_remaining}s remaining",
-                    "time_limit": 15
-                },
-                timestamp=time.time()
-            ))
-            last_countdown = current_remaining
-        
-        await asyncio.sleep(0.5)  # Check every 500ms
+    for current_remaining in range(voting_timeout - 1, 0, -1):
+        await _sleep_until(voting_end - current_remaining)
+        await manager.broadcast_to_lobby(lobby_name, WSEvent(
+            type=WSEventType.GAME_STATE,
+            payload={
+                "phase": "voting_countdown",
+                "countdown": current_remaining,
+                "message": f"Vote for a category! {current_remaining}s remaining",
+                "time_limit": 15
+            },
+            timestamp=time.time()
+        ))
+    
+    await _sleep_until(voting_end)
 
     # Determine winning category
     await _select_winning_category(lobby_name, manager)
 
 async def _select_winning_category(lobby_name: str, manager):
     """Select the winning category and start the trivia round."""
-    storage = await get_storage()
-    lobby = await storage.get_lobby(lobby_name)
+    lobby = _active_lobbies.get(lobby_name)
     
     if not lobby or not isinstance(lobby.current_game, BuzzerTriviaData):
         return
     
     game_data = lobby.current_game
     
+    rng = _rng(lobby_name)
+    
     # Count votes
-    vote_counts = {}
-    for voted_category in game_data.category_votes.values():
-        vote_counts[voted_category] = vote_counts.get(voted_category, 0) + 1
+    vote_counts = Counter(game_data.category_votes.values())
     
     # Select winning category (most votes, or random if tie)
     if vote_counts:
-        max_votes = max(vote_counts.values())
-        winners = [cat for cat, votes in vote_counts.items() if votes == max_votes]
-        game_data.selected_category = random.choice(winners)
+        ranked = vote_counts.most_common()
+        max_votes = ranked[0][1]
+        winners = [cat for cat, votes in ranked if votes == max_votes]
+        game_data.selected_category = rng.choice(winners)
     else:
         # No votes, pick random
-        game_data.selected_category = random.choice(game_data.category_options)
+        game_data.selected_category = rng.choice(game_data.category_options)
     
     # Select a random question from the static question bank
-    questions = TRIVIA_QUESTIONS.get(game_data.selected_category, [])
-    if questions:
-        selected_q = random.choice(questions)
-        game_data.current_question = selected_q["question"]
-        game_data.correct_answer = selected_q["answer"]
-        print(f"📚 Selected static question for {game_data.selected_category}: {game_data.current_question}")
+    _question_decks.pop(lobby_name, None)
+    question = _draw_question(lobby_name, game_data.selected_category)
+    if question:
+        game_data.current_question, game_data.correct_answer = question
+        logger.info("📚 Selected static question for %s: %s", game_data.selected_category, game_data.current_question)
     else:
-        print(f"❌ No questions available for category: {game_data.selected_category}")
+        logger.warning("❌ No questions available for category: %s", game_data.selected_category)
     
-    await storage.set_lobby(lobby_name, lobby)
+    await _save_lobby(lobby_name, lobby)
     
     # Show the category result and start the buzzer round
     await manager.broadcast_to_lobby(lobby_name, WSEvent(
@@ -575,7 +778,7 @@ async def _select_winning_category(lobby_name: str, manager):
         timestamp=time.time()
     ))
     
-    await asyncio.sleep(3)  # Show category for 3 seconds
+    await _pause(lobby_name, 3)  # Show category for 3 seconds
     
     # Start the buzzer round
     await _start_buzzer_round(lobby_name, manager)
@@ -583,26 +786,28 @@ async def _select_winning_category(lobby_name: str, manager):
 async def _start_buzzer_round(lobby_name: str, manager):
     """Start the buzzer round with the trivia question."""
     try:
-        storage = await get_storage()
-        lobby = await storage.get_lobby(lobby_name)
+        lobby = _active_lobbies.get(lobby_name)
         
         if not lobby or not isinstance(lobby.current_game, BuzzerTriviaData):
-            print(f"Invalid lobby or game data for {lobby_name}")
+            logger.warning("Invalid lobby or game data for %s", lobby_name)
             return
         
         game_data = lobby.current_game
         game_data.buzzers = []  # Reset buzzers for this round
+        _buzzed_players[lobby_name] = set()
+        _buzz_events[lobby_name] = asyncio.Event()
         
-        await storage.set_lobby(lobby_name, lobby)
+        await _save_lobby(lobby_name, lobby)
         
         # CRITICAL: Broadcast buzzer_cleared event to reset client-side hasBuzzed state
+        now = time.time()
         await manager.broadcast_to_lobby(lobby_name, WSEvent(
             type=WSEventType.GAME_STATE,
             payload={
                 "phase": "buzzer_cleared", 
                 "message": "🔄 Buzzers reset - everyone can buzz again!"
             },
-            timestamp=time.time()
+            timestamp=now
         ))
         
         # Show the trivia question
@@ -615,11 +820,11 @@ async def _start_buzzer_round(lobby_name: str, manager):
                 "question": game_data.current_question,
                 "message": f"Round {game_data.current_round}: Get ready to buzz in!",
             },
-            timestamp=time.time()
+            timestamp=now
         ))
         
         # Wait 3 seconds for players to read the question
-        await asyncio.sleep(3)
+        await _pause(lobby_name, 3)
         
         # Activate buzzers with countdown
         buzzer_timeout = 10  # 10 seconds for buzzing
@@ -633,55 +838,36 @@ async def _start_buzzer_round(lobby_name: str, manager):
             timestamp=time.time()
         ))
         
-        # Countdown with live updates
-        start_time = time.time()
-        last_countdown = buzzer_timeout
+        # Countdown, one tick per second. Buzz-ins are pushed to everyone by
+        # the buzz handler as they happen, so there's nothing to poll here;
+        # the window just closes early once everyone has buzzed.
+        buzzer_end = asyncio.get_running_loop().time() + buzzer_timeout
+        all_buzzed = _all_buzzed_events[lobby_name] = asyncio.Event()
         
-        while time.time() - start_time < buzzer_timeout:
-            current_remaining = buzzer_timeout - int(time.time() - start_time)
-            
-            # Send countdown update when it changes
-            if current_remaining != last_countdown and current_remaining >= 0:
-                await manager.broadcast_to_lobby(lobby_name, WSEvent(
-                    type=WSEventType.GAME_STATE,
-                    payload={
-                        "phase": "buzzer_countdown",
-                        "countdown": current_remaining,
-                        "message": f"🔔 {current_remaining}s left to buzz in!" if current_remaining > 0 else "🔔 Time's up!",
-                        "keep_buzzing": True
-                    },
-                    timestamp=time.time()
-                ))
-                last_countdown = current_remaining
-            
-            # Check if someone buzzed - but don't end immediately, keep accepting buzzers
-            lobby = await storage.get_lobby(lobby_name)
-            if lobby and isinstance(lobby.current_game, BuzzerTriviaData):
-                game_data = lobby.current_game
-                # Just update live buzzer list, don't end the phase
-                if game_data.buzzers:
-                    await manager.broadcast_to_lobby(lobby_name, WSEvent(
-                        type=WSEventType.GAME_STATE,
-                        payload={
-                            "phase": "live_buzzers",
-                            "buzzer_player": game_data.buzzers[-1]["player"],  # Most recent buzzer
-                            "buzzers": game_data.buzzers,
-                            "message": f"🔔 {len(game_data.buzzers)} player(s) buzzed in! {current_remaining}s remaining",
-                            "keep_buzzing": True,
-                            "countdown": current_remaining
-                        },
-                        timestamp=time.time()
-                    ))
-            
-            await asyncio.sleep(0.5)  # Check every 500ms
+        for current_remaining in range(buzzer_timeout - 1, 0, -1):
+            if await _wait_until(all_buzzed, buzzer_end - current_remaining):
+                break
+            await manager.broadcast_to_lobby(lobby_name, WSEvent(
+                type=WSEventType.GAME_STATE,
+                payload={
+                    "phase": "buzzer_countdown",
+                    "countdown": current_remaining,
+                    "message": f"🔔 {current_remaining}s left to buzz in!",
+                    "keep_buzzing": True
+                },
+                timestamp=time.time()
+            ))
+        else:
+            await _wait_until(all_buzzed, buzzer_end)
+        _all_buzzed_events.pop(lobby_name, None)
         
-        # Time's up! Now show final buzzer results
-        lobby = await storage.get_lobby(lobby_name)
-        if lobby and isinstance(lobby.current_game, BuzzerTriviaData):
-            game_data = lobby.current_game
-            if game_data.buzzers:
-                await _show_buzzer_order(lobby_name, manager)
-                return
+        # Time's up! Now show final buzzer results (host_judging carries the
+        # full list, so a live update still pending would only arrive late)
+        _cancel_live_buzzers(lobby_name)
+        buzz_event = _buzz_events.pop(lobby_name, None)
+        if buzz_event and buzz_event.is_set():
+            await _show_buzzer_order(lobby_name, manager)
+            return
         
         # Timeout - no one buzzed
         await manager.broadcast_to_lobby(lobby_name, WSEvent(
@@ -693,36 +879,35 @@ async def _start_buzzer_round(lobby_name: str, manager):
             timestamp=time.time()
         ))
         
-        await asyncio.sleep(3)
+        await _pause(lobby_name, 3)
         
         # End round or continue to next question
         await _end_buzzer_round(lobby_name, manager)
         
-    except Exception as e:
-        print(f"Error in _start_buzzer_round: {e}")
+    except Exception:
+        logger.exception("Error in _start_buzzer_round for %s", lobby_name)
+        _buzz_events.pop(lobby_name, None)
         await _end_buzzer_trivia_game(lobby_name, manager)
 
 async def _show_buzzer_order(lobby_name: str, manager):
     """Show buzzer order and wait for host to award points."""
-    storage = await get_storage()
-    lobby = await storage.get_lobby(lobby_name)
+    lobby = _active_lobbies.get(lobby_name)
     
     if not lobby or not isinstance(lobby.current_game, BuzzerTriviaData):
         return
     
     game_data = lobby.current_game
     
-    # Sort buzzers by time (earliest first)
-    game_data.buzzers.sort(key=lambda x: x["time"])
-    
-    # Assign positions
+    # Buzzers are appended as the server receives them, so list order is
+    # buzz order; no sort on (client or wall-clock) timestamps needed
     for i, buzzer in enumerate(game_data.buzzers):
         buzzer["position"] = i + 1
     
-    await storage.set_lobby(lobby_name, lobby)
+    await _save_lobby(lobby_name, lobby)
     
     # Show buzzer order to everyone, answer only to host
-    await manager.broadcast_to_lobby(lobby_name, WSEvent(
+    now = time.time()
+    await _broadcast_with_host_followup(lobby_name, lobby.host, WSEvent(
         type=WSEventType.GAME_STATE,
         payload={
             "phase": "host_judging",
@@ -731,12 +916,8 @@ async def _show_buzzer_order(lobby_name: str, manager):
             "message": f"🔔 Waiting for host to award points...",
             "show_answer_to_host_only": True
         },
-        timestamp=time.time()
-    ))
-    
-    # Send answer separately to host only
-    host_player = lobby.host
-    await manager.send_to_player(lobby_name, host_player, WSEvent(
+        timestamp=now
+    ), WSEvent(
         type=WSEventType.GAME_STATE,
         payload={
             "phase": "host_answer",
@@ -744,15 +925,14 @@ async def _show_buzzer_order(lobby_name: str, manager):
             "host_controls": True,
             "message": f"🎯 ANSWER: {game_data.correct_answer}"
         },
-        timestamp=time.time()
-    ))
+        timestamp=now
+    ), manager)
     
     # Don't auto-advance - wait for host action
 
 async def _end_buzzer_round(lobby_name: str, manager):
     """End the current round and either start next question or end game."""
-    storage = await get_storage()
-    lobby = await storage.get_lobby(lobby_name)
+    lobby = _active_lobbies.get(lobby_name)
     
     if not lobby or not isinstance(lobby.current_game, BuzzerTriviaData):
         return
@@ -769,38 +949,37 @@ async def _end_buzzer_round(lobby_name: str, manager):
 
 async def _start_next_question(lobby_name: str, manager):
     """Start the next trivia question."""
-    storage = await get_storage()
-    lobby = await storage.get_lobby(lobby_name)
+    lobby = _active_lobbies.get(lobby_name)
     
     if not lobby or not isinstance(lobby.current_game, BuzzerTriviaData):
         return
     
     game_data = lobby.current_game
     
-    # Select a new random question from the static question bank
-    questions = TRIVIA_QUESTIONS.get(game_data.selected_category, [])
-    if questions:
-        selected_q = random.choice(questions)
-        game_data.current_question = selected_q["question"]
-        game_data.correct_answer = selected_q["answer"]
-        print(f"📚 Next question for {game_data.selected_category}: {game_data.current_question}")
+    # Select the next unasked question from the static question bank
+    question = _draw_question(lobby_name, game_data.selected_category)
+    if question:
+        game_data.current_question, game_data.correct_answer = question
+        logger.info("📚 Next question for %s: %s", game_data.selected_category, game_data.current_question)
     else:
-        print(f"❌ No questions available for category: {game_data.selected_category}")
+        logger.warning("❌ No questions available for category: %s", game_data.selected_category)
     
     # Reset buzzers for new round
     game_data.buzzers = []
+    _buzzed_players[lobby_name] = set()
     
-    await storage.set_lobby(lobby_name, lobby)
+    await _save_lobby(lobby_name, lobby)
     
     # CRITICAL: Broadcast buzzer_cleared event to reset client-side hasBuzzed state
     # This follows the open-source pattern from research to enable repeat buzz-ins
+    now = time.time()
     await manager.broadcast_to_lobby(lobby_name, WSEvent(
         type=WSEventType.GAME_STATE,
         payload={
             "phase": "buzzer_cleared",
             "message": "🔄 Buzzers reset for new question - everyone can buzz again!"
         },
-        timestamp=time.time()
+        timestamp=now
     ))
     
     # Show new question
@@ -813,40 +992,33 @@ async def _start_next_question(lobby_name: str, manager):
             "question": game_data.current_question,
             "message": f"Round {game_data.current_round} coming up!",
         },
-        timestamp=time.time()
+        timestamp=now
     ))
     
-    await asyncio.sleep(2)
+    await _pause(lobby_name, 2)
     
     # Start the new buzzer round
     await _start_buzzer_round(lobby_name, manager)
 
+async def _host_next_question(lobby_name: str, manager):
+    """Next question requested by the host, after a brief pause."""
+    await _pause(lobby_name, 2)
+    await _start_next_question(lobby_name, manager)
+
 async def _end_buzzer_trivia_game(lobby_name: str, manager):
     """End the buzzer trivia game and show final results."""
-    storage = await get_storage()
-    lobby = await storage.get_lobby(lobby_name)
+    lobby = _active_lobbies.get(lobby_name)
+    _discard_runtime(lobby_name)
     
     if not lobby or not isinstance(lobby.current_game, BuzzerTriviaData):
         return
     
     game_data = lobby.current_game
     game_data.state = GameState.FINISHED
-    game_data.end_time = time.time()
+    game_data.end_time = now = time.time()
     
     # Calculate final scores based on host-awarded points (no auto-scoring)
-    scores = []
-    for player in lobby.players:
-        score = game_data.total_scores.get(player.name, 0)  # Only host-awarded points
-        scores.append(PlayerScore(
-            player_name=player.name,
-            score=score,
-            position=0
-        ))
-    
-    # Sort by score descending
-    scores.sort(key=lambda x: x.score, reverse=True)
-    for i, score in enumerate(scores):
-        score.position = i + 1
+    scores = _rank_players(lobby, game_data.total_scores)
     
     # Determine winner
     winner = scores[0].player_name if scores and scores[0].score > 0 else None
@@ -866,19 +1038,19 @@ async def _end_buzzer_trivia_game(lobby_name: str, manager):
     for player in lobby.players:
         player.is_ready = False
     
+    storage = get_storage_sync()
     await storage.set_lobby(lobby_name, lobby)
     
     # Broadcast results
     await manager.broadcast_to_lobby(lobby_name, WSEvent(
         type=WSEventType.GAME_FINISHED,
-        payload={"results": results.model_dump()},
-        timestamp=time.time()
+        payload={"results": results},
+        timestamp=now
     ))
 
 async def handle_buzzer_trivia_action(lobby_name: str, player_name: str, action: str, payload: dict, manager):
     """Handle Buzzer Trivia specific actions."""
-    storage = await get_storage()
-    lobby = await storage.get_lobby(lobby_name)
+    lobby = _active_lobbies.get(lobby_name)
     
     if not lobby or not isinstance(lobby.current_game, BuzzerTriviaData):
         return
@@ -889,7 +1061,7 @@ async def handle_buzzer_trivia_action(lobby_name: str, player_name: str, action:
         category = payload.get("category")
         if category and category in game_data.category_options:
             game_data.category_votes[player_name] = category
-            await storage.set_lobby(lobby_name, lobby)
+            _dirty_lobbies.add(lobby_name)
             
             # Confirm vote
             await manager.send_to_player(lobby_name, player_name, WSEvent(
@@ -899,78 +1071,68 @@ async def handle_buzzer_trivia_action(lobby_name: str, player_name: str, action:
             ))
     
     elif action == "buzz":
-        print(f"===== BACKEND BUZZ ACTION =====")
-        print(f"Player: {player_name}")
-        print(f"Is Host: {player_name == lobby.host}")
-        print(f"Lobby Host: {lobby.host}")
-        print(f"Current Buzzers: {[b['player'] for b in game_data.buzzers]}")
-        print(f"Current Round: {game_data.current_round}")
-        print(f"Current Category: {game_data.selected_category}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "🔔 Buzz from %s in %s (host %s, round %s, %s); buzzed so far: %s",
+                player_name, lobby_name, lobby.host, game_data.current_round,
+                game_data.selected_category, [b["player"] for b in game_data.buzzers],
+            )
         
-        buzz_time = payload.get("timestamp", time.time())
+        now = time.time()
         
         # Check if player already buzzed
-        player_already_buzzed = any(b["player"] == player_name for b in game_data.buzzers)
-        print(f"Player {player_name} already buzzed: {player_already_buzzed}")
+        buzzed = _buzzed_players.setdefault(lobby_name, set())
+        player_already_buzzed = player_name in buzzed
         
         if not player_already_buzzed:
             buzz_entry = {
                 "player": player_name,
-                "time": buzz_time,
+                "time": now,  # display only; order is arrival order
                 "position": 0  # Will be calculated later
             }
-            print(f"Creating buzz entry: {buzz_entry}")
             
             game_data.buzzers.append(buzz_entry)
-            print(f"✅ ADDED {player_name} to buzzers list. Total buzzers: {len(game_data.buzzers)}")
-            print(f"Updated buzzer list: {[b['player'] for b in game_data.buzzers]}")
+            buzzed.add(player_name)
+            _dirty_lobbies.add(lobby_name)
+            logger.debug("✅ %s buzzed in (#%d)", player_name, len(game_data.buzzers))
             
-            await storage.set_lobby(lobby_name, lobby)
-            print(f"✅ SAVED lobby state to storage")
+            buzz_event = _buzz_events.get(lobby_name)
+            if buzz_event:
+                buzz_event.set()
+            if len(buzzed) >= len(lobby.players):
+                all_buzzed = _all_buzzed_events.get(lobby_name)
+                if all_buzzed:
+                    all_buzzed.set()
             
             # Confirm buzz
             await manager.send_to_player(lobby_name, player_name, WSEvent(
                 type=WSEventType.GAME_STATE,
                 payload={"buzz_confirmed": True},
-                timestamp=time.time()
+                timestamp=now
             ))
-            print(f"✅ SENT buzz confirmation to {player_name}")
             
-            # Broadcast live buzzer update to everyone
-            await manager.broadcast_to_lobby(lobby_name, WSEvent(
-                type=WSEventType.GAME_STATE,
-                payload={
-                    "phase": "live_buzzers",
-                    "buzzer_player": player_name,
-                    "buzzers": game_data.buzzers,
-                    "message": f"🔔 {player_name} buzzed in! (#{len(game_data.buzzers)})",
-                    "keep_buzzing": True  # Keep buzzers active
-                },
-                timestamp=time.time()
-            ))
-            print(f"✅ BROADCAST live buzzer update with {len(game_data.buzzers)} buzzers")
+            # Live buzzer update to everyone, shared with near-simultaneous buzzes
+            _queue_live_buzzers(lobby_name, game_data, manager)
         else:
-            print(f"❌ BUZZ BLOCKED - {player_name} already buzzed")
-        
-        print(f"===== END BUZZ ACTION =====")
+            logger.debug("❌ Buzz blocked - %s already buzzed", player_name)
     
     elif action == "award_points":
         # Only the host can award points
         if player_name != lobby.host:
-            print(f"Non-host {player_name} tried to award points (host is {lobby.host})")
+            logger.warning("Non-host %s tried to award points (host is %s)", player_name, lobby.host)
             return
             
         awarded_player = payload.get("player_name")
         points = payload.get("points", 1)
         
-        print(f"Host {player_name} awarding {points} points to {awarded_player}")
+        logger.info("Host %s awarding %s points to %s", player_name, points, awarded_player)
         
-        if awarded_player and awarded_player in [p.name for p in lobby.players]:
+        if awarded_player and lobby.has_player(awarded_player):
             # Award points
             game_data.total_scores[awarded_player] = game_data.total_scores.get(awarded_player, 0) + points
-            await storage.set_lobby(lobby_name, lobby)
+            _dirty_lobbies.add(lobby_name)
             
-            print(f"Points awarded! {awarded_player} now has {game_data.total_scores[awarded_player]} total points")
+            logger.info("Points awarded! %s now has %s total points", awarded_player, game_data.total_scores[awarded_player])
             
             # Broadcast point award
             await manager.broadcast_to_lobby(lobby_name, WSEvent(
@@ -985,35 +1147,42 @@ async def handle_buzzer_trivia_action(lobby_name: str, player_name: str, action:
                 timestamp=time.time()
             ))
         else:
-            print(f"Invalid player for point award: {awarded_player}")
+            logger.warning("Invalid player for point award: %s", awarded_player)
     
     elif action == "next_question":
         # Only the host can trigger next question
         if player_name == lobby.host:
-            await asyncio.sleep(2)  # Brief pause before next question
-            await _start_next_question(lobby_name, manager)
+            pacing = _pacing_events.get(lobby_name)
+            if pacing:
+                # The game loop is between phases; let it move on now
+                pacing.set()
+            elif lobby_name not in _lobby_tasks:
+                # Waiting on the host: run the next question as the game loop
+                _spawn_game_loop(lobby_name, _host_next_question(lobby_name, manager))
     
     elif action == "end_game":
         # Only the host can end the game
         if player_name == lobby.host:
+            await _stop_game_loop(lobby_name)
             await _end_buzzer_trivia_game(lobby_name, manager)
     
     elif action == "generate_question":
         # Only the host can generate questions
         if player_name == lobby.host:
             category = payload.get("category", game_data.selected_category)
-            print(f"Host {player_name} requested AI question for category: {category}")
+            logger.info("Host %s requested AI question for category: %s", player_name, category)
             
             try:
-                ai_question = await get_ai_question(category)
+                ai_question = await _next_ai_question(lobby_name, category)
                 if ai_question:
                     # Update the current question
                     game_data.current_question = ai_question["question"]
                     game_data.correct_answer = ai_question["answer"]
-                    await storage.set_lobby(lobby_name, lobby)
+                    _dirty_lobbies.add(lobby_name)
                     
-                    # Broadcast new question to everyone
-                    await manager.broadcast_to_lobby(lobby_name, WSEvent(
+                    # Broadcast new question to everyone, answer to host only
+                    now = time.time()
+                    await _broadcast_with_host_followup(lobby_name, player_name, WSEvent(
                         type=WSEventType.GAME_STATE,
                         payload={
                             "phase": "question_updated",
@@ -1023,11 +1192,8 @@ async def handle_buzzer_trivia_action(lobby_name: str, player_name: str, action:
                             "message": f"🤖 Host generated a new AI question!",
                             "source": "AI-generated"
                         },
-                        timestamp=time.time()
-                    ))
-                    
-                    # Send answer to host only
-                    await manager.send_to_player(lobby_name, player_name, WSEvent(
+                        timestamp=now
+                    ), WSEvent(
                         type=WSEventType.GAME_STATE,
                         payload={
                             "phase": "host_answer",
@@ -1035,10 +1201,10 @@ async def handle_buzzer_trivia_action(lobby_name: str, player_name: str, action:
                             "host_controls": True,
                             "message": f"🤖 AI Answer: {game_data.correct_answer}"
                         },
-                        timestamp=time.time()
-                    ))
+                        timestamp=now
+                    ), manager)
                     
-                    print(f"AI question generated and sent to lobby")
+                    logger.info("AI question generated and sent to %s", lobby_name)
                 else:
                     await manager.send_to_player(lobby_name, player_name, WSEvent(
                         type=WSEventType.GAME_STATE,
@@ -1048,10 +1214,10 @@ async def handle_buzzer_trivia_action(lobby_name: str, player_name: str, action:
                         },
                         timestamp=time.time()
                     ))
-                    print(f"Failed to generate AI question for {category}")
+                    logger.warning("Failed to generate AI question for %s", category)
                     
-            except Exception as e:
-                print(f"Error generating AI question: {e}")
+            except Exception:
+                logger.exception("Error generating AI question")
                 await manager.send_to_player(lobby_name, player_name, WSEvent(
                     type=WSEventType.GAME_STATE,
                     payload={
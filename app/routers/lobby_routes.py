@@ -7,7 +7,7 @@ from app.schemas.game import StartGameRequest, GameType, GameState, WSEvent, WSE
 from app.utils.storage import get_storage, StorageBackend
 from app.utils.errors import *
 from app.utils.ids import validate_name, generate_player_id
-from app.routers.game_logic import start_tap_gauntlet, start_buzzer_trivia
+from app.routers.game_logic import start_tap_gauntlet, start_buzzer_trivia, cancel_game
 
 router = APIRouter(prefix="/lobby", tags=["lobby"])
 
@@ -55,7 +55,7 @@ async def join_lobby(data: LobbyJoin, storage: StorageBackend = Depends(get_stor
         raise lobby_not_found_error(data.lobby_name)
     
     # Check if player already in lobby
-    if any(p.name == data.player_name for p in lobby.players):
+    if lobby.has_player(data.player_name):
         raise player_already_in_lobby_error(data.player_name)
     
     # Check lobby capacity
@@ -179,6 +179,7 @@ async def force_delete_lobby(
         # Continue anyway - just delete the lobby
     
     # Delete the lobby
+    await cancel_game(lobby_name)
     await storage.delete_lobby(lobby_name)
     print(f"Force deleted lobby: {lobby_name}")
     
@@ -273,5 +274,6 @@ async def delete_lobby(
     if host_token != lobby.host_token:
         raise host_only_action_error()
     
+    await cancel_game(lobby_name)
     await storage.delete_lobby(lobby_name)
     return {"ok": True}
@@ -1,15 +1,22 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, WebSocketException
-from typing import Dict, Set
-import json
+from typing import Collection, Dict, Set
 import asyncio
+import orjson
 import time
 from app.schemas.game import WSEvent, WSEventType, GameState
 from app.schemas.lobby import Lobby, Player
-from app.utils.storage import get_storage
+from app.utils.storage import get_storage_sync
 from app.utils.errors import lobby_not_found_error
+from app.utils.ws_encoding import encode_event
+from app.routers.game_logic import cancel_game, handle_buzzer_trivia_action, handle_tap_gauntlet_action
 
 router = APIRouter()
 
+# A send that takes longer than this is treated as a dead connection
+SEND_TIMEOUT_SECONDS = 5.0
+# Upper bound on sends in flight at once across all broadcasts
+MAX_CONCURRENT_SENDS = 100
+
 # Connection management
 class ConnectionManager:
     def __init__(self):
@@ -17,6 +24,7 @@ class ConnectionManager:
         self.active_connections: Dict[str, Set[WebSocket]] = {}
         # websocket -> (lobby_name, player_name)
         self.connection_info: Dict[WebSocket, tuple[str, str]] = {}
+        self._send_slots = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
     
     async def connect(self, websocket: WebSocket, lobby_name: str, player_name: str):
         await websocket.accept()
@@ -47,7 +55,7 @@ class ConnectionManager:
             del self.connection_info[websocket]
             
             # Remove player from lobby data
-            storage = await get_storage()
+            storage = get_storage_sync()
             lobby = await storage.get_lobby(lobby_name)
             if lobby:
                 # Remove the player from the lobby
@@ -70,51 +78,58 @@ class ConnectionManager:
                 # Send updated lobby state
                 await self.broadcast_to_lobby(lobby_name, WSEvent(
                     type=WSEventType.LOBBY_UPDATED,
-                    payload={"lobby": lobby.model_dump()},
+                    payload={"lobby": lobby},
                     timestamp=time.time()
                 ))
             
             # Clean up empty lobbies
             await self._cleanup_empty_lobby(lobby_name)
     
-    async def broadcast_to_lobby(self, lobby_name: str, event: WSEvent, exclude: WebSocket = None):
+    async def broadcast_to_lobby(self, lobby_name: str, event: WSEvent, exclude: WebSocket = None, exclude_player: str = None, only_players: Collection[str] = None):
         if lobby_name not in self.active_connections:
             return
         
-        message = event.model_dump_json()
-        connections_to_remove = []
+        message = encode_event(event)  # encoded once, sent to every recipient
+        recipients = [ws for ws in self.active_connections[lobby_name] if ws is not exclude]
+        if exclude_player is not None:
+            recipients = [ws for ws in recipients if self.connection_info.get(ws, (None, None))[1] != exclude_player]
+        if only_players is not None:
+            recipients = [ws for ws in recipients if self.connection_info.get(ws, (None, None))[1] in only_players]
         
-        for websocket in self.active_connections[lobby_name]:
-            if exclude and websocket == exclude:
-                continue
-            
-            try:
-                await websocket.send_text(message)
-            except Exception:
-                connections_to_remove.append(websocket)
+        # Send to everyone concurrently: one slow client no longer delays the rest
+        results = await asyncio.gather(*(self._safe_send(ws, message) for ws in recipients))
         
         # Remove dead connections
-        for websocket in connections_to_remove:
-            await self.disconnect(websocket)
+        for websocket, ok in zip(recipients, results):
+            if not ok:
+                await self.disconnect(websocket)
+    
+    async def _safe_send(self, websocket: WebSocket, message: str) -> bool:
+        """Send one text frame; False if the socket failed or stalled past the timeout."""
+        async with self._send_slots:
+            try:
+                async with asyncio.timeout(SEND_TIMEOUT_SECONDS):
+                    await websocket.send_text(message)
+                return True
+            except Exception:
+                return False
     
     async def send_to_player(self, lobby_name: str, player_name: str, event: WSEvent):
         if lobby_name not in self.active_connections:
             return
         
-        message = event.model_dump_json()
+        message = encode_event(event)
         for websocket in self.active_connections[lobby_name]:
             if websocket in self.connection_info:
                 _, ws_player_name = self.connection_info[websocket]
                 if ws_player_name == player_name:
-                    try:
-                        await websocket.send_text(message)
-                    except Exception:
+                    if not await self._safe_send(websocket, message):
                         await self.disconnect(websocket)
                     break
     
     async def _cleanup_empty_lobby(self, lobby_name: str):
         """Remove lobby if no connections remain or no players left."""
-        storage = await get_storage()
+        storage = get_storage_sync()
         lobby = await storage.get_lobby(lobby_name)
         
         # Check if lobby should be cleaned up
@@ -134,13 +149,14 @@ class ConnectionManager:
                         pass
                 del self.active_connections[lobby_name]
             
-            # Remove lobby from storage
+            # Stop any game still running, then remove lobby from storage
+            await cancel_game(lobby_name)
             await storage.delete_lobby(lobby_name)
             print(f"Deleted empty lobby: {lobby_name}")
     
     async def cleanup_all_empty_lobbies(self):
         """Cleanup all lobbies that have no connections."""
-        storage = await get_storage()
+        storage = get_storage_sync()
         lobbies = await storage.list_lobbies()
         
         for lobby in lobbies:
@@ -155,7 +171,7 @@ manager = ConnectionManager()
 
 @router.websocket("/ws/lobby/{lobby_name}")
 async def websocket_endpoint(websocket: WebSocket, lobby_name: str, player_name: str):
-    storage = await get_storage()
+    storage = get_storage_sync()
     
     # Verify lobby exists
     lobby = await storage.get_lobby(lobby_name)
@@ -164,7 +180,7 @@ async def websocket_endpoint(websocket: WebSocket, lobby_name: str, player_name:
         return
     
     # Verify player is in lobby
-    player_in_lobby = any(p.name == player_name for p in lobby.players)
+    player_in_lobby = lobby.has_player(player_name)
     if not player_in_lobby:
         await websocket.close(code=4009, reason="Player not in lobby")
         return
@@ -173,17 +189,17 @@ async def websocket_endpoint(websocket: WebSocket, lobby_name: str, player_name:
     
     try:
         # Send initial lobby state
-        await websocket.send_text(WSEvent(
+        await websocket.send_text(encode_event(WSEvent(
             type=WSEventType.LOBBY_UPDATED,
             payload={
-                "lobby": lobby.model_dump(),
+                "lobby": lobby,
                 "connected_players": [
                     info[1] for info in manager.connection_info.values() 
                     if info[0] == lobby_name
                 ]
             },
             timestamp=time.time()
-        ).model_dump_json())
+        )))
         
         while True:
             data = await websocket.receive_text()
@@ -198,18 +214,25 @@ async def websocket_endpoint(websocket: WebSocket, lobby_name: str, player_name:
 async def handle_websocket_message(websocket: WebSocket, lobby_name: str, player_name: str, data: str):
     """Handle incoming WebSocket messages."""
     try:
-        message = json.loads(data)
+        message = orjson.loads(data)
         event_type = message.get("type")
         payload = message.get("payload", {})
         
-        storage = await get_storage()
+        # Taps are by far the most frequent message. Tap Gauntlet checks them
+        # (rate limit included) against its in-memory lobby, so skip the
+        # storage lookups below entirely.
+        if event_type == WSEventType.GAME_ACTION and payload.get("action") == "tap":
+            await handle_tap_gauntlet_action(lobby_name, player_name, "tap", payload, manager)
+            return
+        
+        storage = get_storage_sync()
         lobby = await storage.get_lobby(lobby_name)
         if not lobby:
-            await websocket.send_text(WSEvent(
+            await websocket.send_text(encode_event(WSEvent(
                 type=WSEventType.ERROR,
                 payload={"error": "Lobby not found"},
                 timestamp=time.time()
-            ).model_dump_json())
+            )))
             return
         
         if event_type == WSEventType.PLAYER_READY:
@@ -234,28 +257,29 @@ async def handle_websocket_message(websocket: WebSocket, lobby_name: str, player
             await handle_game_action(lobby_name, player_name, payload)
         
         elif event_type == WSEventType.PING:
-            await websocket.send_text(WSEvent(
+            now = time.time()
+            await websocket.send_text(encode_event(WSEvent(
                 type=WSEventType.PONG,
-                payload={"timestamp": time.time()},
-                timestamp=time.time()
-            ).model_dump_json())
+                payload={"timestamp": now},
+                timestamp=now
+            )))
         
-    except json.JSONDecodeError:
-        await websocket.send_text(WSEvent(
+    except orjson.JSONDecodeError:
+        await websocket.send_text(encode_event(WSEvent(
             type=WSEventType.ERROR,
             payload={"error": "Invalid JSON"},
             timestamp=time.time()
-        ).model_dump_json())
+        )))
     except Exception as e:
-        await websocket.send_text(WSEvent(
+        await websocket.send_text(encode_event(WSEvent(
             type=WSEventType.ERROR,
             payload={"error": str(e)},
             timestamp=time.time()
-        ).model_dump_json())
+        )))
 
 async def cleanup_stale_connections():
     """Clean up connections that might have failed to disconnect properly."""
-    storage = await get_storage()
+    storage = get_storage_sync()
     all_lobbies = await storage.get_all_lobbies()
     
     for lobby_name, lobby in all_lobbies.items():
@@ -277,13 +301,13 @@ async def cleanup_stale_connections():
                 # Broadcast updated lobby
                 await manager.broadcast_to_lobby(lobby_name, WSEvent(
                     type=WSEventType.LOBBY_UPDATED,
-                    payload={"lobby": lobby.model_dump()},
+                    payload={"lobby": lobby},
                     timestamp=time.time()
                 ))
 
 async def handle_player_ready(lobby_name: str, player_name: str, is_ready: bool):
     """Handle player ready/unready state changes."""
-    storage = await get_storage()
+    storage = get_storage_sync()
     lobby = await storage.get_lobby(lobby_name)
     if not lobby:
         return
@@ -299,36 +323,33 @@ async def handle_player_ready(lobby_name: str, player_name: str, is_ready: bool)
     # Broadcast lobby update
     await manager.broadcast_to_lobby(lobby_name, WSEvent(
         type=WSEventType.LOBBY_UPDATED,
-        payload={"lobby": lobby.model_dump()},
+        payload={"lobby": lobby},
         timestamp=time.time()
     ))
 
 async def handle_game_action(lobby_name: str, player_name: str, payload: dict):
     """Handle game-specific actions."""
-    storage = await get_storage()
+    storage = get_storage_sync()
     lobby = await storage.get_lobby(lobby_name)
     if not lobby or not lobby.current_game:
         return
     
     action = payload.get("action")
     
-    # Import game logic here to avoid circular imports
     if lobby.current_game.game_type == "tap_gauntlet":
-        from app.routers.game_logic import handle_tap_gauntlet_action
         await handle_tap_gauntlet_action(lobby_name, player_name, action, payload, manager)
     elif lobby.current_game.game_type == "buzzer_trivia":
-        from app.routers.game_logic import handle_buzzer_trivia_action
         await handle_buzzer_trivia_action(lobby_name, player_name, action, payload, manager)
 
 # Utility function to broadcast lobby updates
 async def broadcast_lobby_update(lobby_name: str):
     """Broadcast lobby state to all connected clients."""
-    storage = await get_storage()
+    storage = get_storage_sync()
     lobby = await storage.get_lobby(lobby_name)
     if lobby:
         await manager.broadcast_to_lobby(lobby_name, WSEvent(
             type=WSEventType.LOBBY_UPDATED,
-            payload={"lobby": lobby.model_dump()},
+            payload={"lobby": lobby},
             timestamp=time.time()
         ))
 
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Dict, List, Optional, Literal, Any, Union
 from enum import Enum
 
@@ -40,9 +40,9 @@ class TapGauntletData(BaseGameData):
     game_type: Literal[GameType.TAP_GAUNTLET] = GameType.TAP_GAUNTLET
     duration_seconds: int = 10
     player_taps: Dict[str, int] = {}
-    last_tap_times: Dict[str, float] = {}
+    last_tap_times: Dict[str, float] = {}  # time.monotonic() of each player's last counted tap
     max_taps_per_second: int = 20  # Anti-cheat rate limit
-    server_prompts: Dict[str, List[float]] = {}  # Random server validation prompts
+    server_prompts: Dict[str, float] = {}  # player -> time of their latest validation prompt
 
 # Impostor Prompt specific data
 class ImpostorPromptData(BaseGameData):
@@ -57,16 +57,16 @@ class ImpostorPromptData(BaseGameData):
 # Buzzer Trivia specific data
 class BuzzerTriviaData(BaseGameData):
     game_type: Literal[GameType.BUZZER_TRIVIA] = GameType.BUZZER_TRIVIA
-    category_options: List[str] = []  # Categories to vote on
-    category_votes: Dict[str, str] = {}  # player -> category_voted_for
+    category_options: List[str] = Field(default_factory=list)  # Categories to vote on
+    category_votes: Dict[str, str] = Field(default_factory=dict)  # player -> category_voted_for
     selected_category: str = ""  # Winning category
     current_question: str = ""  # The trivia question
     correct_answer: str = ""  # The correct answer
-    buzzers: List[Dict[str, Any]] = []  # [{"player": "name", "time": 123.45, "position": 1}]
+    buzzers: List[Dict[str, Any]] = Field(default_factory=list)  # [{"player": "name", "time": 123.45, "position": 1}]
     current_round: int = 1
     max_rounds: int = 3
-    round_scores: Dict[str, int] = {}  # player -> points this round
-    total_scores: Dict[str, int] = {}  # player -> total points
+    round_scores: Dict[str, int] = Field(default_factory=dict)  # player -> points this round
+    total_scores: Dict[str, int] = Field(default_factory=dict)  # player -> total points
 
 # Shotgun Roulette specific data
 class ShotgunRouletteData(BaseGameData):
@@ -15,6 +15,10 @@ class Lobby(BaseModel):
     current_game: Optional[GameData] = None
     host_token: Optional[str] = None
 
+    def has_player(self, name: str) -> bool:
+        """Whether a player with this name is in the lobby."""
+        return any(player.name == name for player in self.players)
+
 class LobbyCreate(BaseModel):
     lobby_name: str
     player_name: str
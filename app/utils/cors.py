@@ -0,0 +1,67 @@
+from typing import List, Tuple
+
+Headers = List[Tuple[bytes, bytes]]
+
+# Static parts of every CORS response, built once at import
+_CORS_HEADERS: Headers = [
+    (b"access-control-allow-credentials", b"true"),
+    (b"vary", b"Origin"),
+]
+_PREFLIGHT_HEADERS: Headers = _CORS_HEADERS + [
+    (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+    # Browsers cap this themselves (Chrome at 2h), so ask for a full day
+    (b"access-control-max-age", b"86400"),
+]
+_PREFLIGHT_BODY = {"type": "http.response.body", "body": b""}
+
+class FastCORSMiddleware:
+    """Pure ASGI CORS middleware that allows any origin.
+
+    Replaces Starlette's CORSMiddleware for the "allow everything" case.
+    The request's Origin is echoed back instead of "*" because "*" is
+    not valid together with allow-credentials.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        # Browsers don't apply CORS to WebSocket handshakes, so websocket
+        # (and lifespan) scopes go straight through without a header scan
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        preflight_method = None
+        preflight_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                preflight_method = value
+            elif name == b"access-control-request-headers":
+                preflight_headers = value
+
+        # Same-origin and non-browser requests need no CORS headers
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and preflight_method is not None:
+            headers = [(b"access-control-allow-origin", origin), *_PREFLIGHT_HEADERS]
+            if preflight_headers is not None:
+                headers.append((b"access-control-allow-headers", preflight_headers))
+            await send({"type": "http.response.start", "status": 204, "headers": headers})
+            await send(_PREFLIGHT_BODY)
+            return
+
+        cors_headers = [(b"access-control-allow-origin", origin), *_CORS_HEADERS]
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                # Build a new list: responses may share their raw header list
+                message["headers"] = [*message.get("headers", ()), *cors_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
@@ -0,0 +1,62 @@
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Callable, List, Tuple
+
+# Loggers that may already have handlers attached when the app starts:
+# uvicorn's default config (start.py / run.py) or gunicorn's handlers
+# (app/workers.py) are installed on these, with propagate=False.
+_SERVER_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+
+_ROOT_FORMAT = "%(levelname)s:     %(name)s - %(message)s"
+
+class _LocalQueueHandler(QueueHandler):
+    """QueueHandler that enqueues records untouched.
+
+    The queue never leaves the process, so there's no need to pre-format
+    and strip the record; leaving `record.args` intact lets formatters
+    like uvicorn's AccessFormatter still work on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+def _move_behind_queue(logger: logging.Logger) -> Tuple[QueueListener, List[logging.Handler]]:
+    """Replace a logger's handlers with a QueueHandler feeding them from a thread."""
+    handlers = list(logger.handlers)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    logger.handlers = [_LocalQueueHandler(log_queue)]
+    return listener, handlers
+
+def start_queue_logging(level: int = logging.INFO) -> Callable[[], None]:
+    """Move all log output (stdout writes, etc.) onto background threads.
+
+    Handlers already installed on the server loggers keep their
+    formatting but are driven by a QueueListener; the root logger gets a
+    stdout handler behind a queue if nothing configured it. Returns a
+    function that flushes the queues and puts the original handlers back.
+    """
+    root = logging.getLogger()
+    if not root.handlers:
+        stdout_handler = logging.StreamHandler(sys.stdout)
+        stdout_handler.setFormatter(logging.Formatter(_ROOT_FORMAT))
+        root.addHandler(stdout_handler)
+        # Our own loggers at `level`; third-party libraries only at WARNING
+        root.setLevel(logging.WARNING)
+        logging.getLogger("app").setLevel(level)
+
+    moved = []
+    for logger in (root, *map(logging.getLogger, _SERVER_LOGGERS)):
+        if logger.handlers:
+            listener, handlers = _move_behind_queue(logger)
+            listener.start()
+            moved.append((logger, listener, handlers))
+
+    def stop() -> None:
+        for logger, listener, handlers in moved:
+            listener.stop()
+            logger.handlers = handlers
+
+    return stop
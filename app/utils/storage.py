@@ -79,5 +79,9 @@ class MemoryStorage(StorageBackend):
 storage: StorageBackend = MemoryStorage()
 
 async def get_storage() -> StorageBackend:
-    """Get the current storage backend."""
+    """Get the current storage backend (FastAPI dependency)."""
+    return storage
+
+def get_storage_sync() -> StorageBackend:
+    """Get the current storage backend without an await (game loops, WS handlers)."""
     return storage
@@ -0,0 +1,24 @@
+import orjson
+from pydantic import BaseModel
+from app.schemas.game import WSEvent
+
+def _encode_model(obj):
+    # Models in a payload (lobby, results) are serialized by pydantic-core
+    # straight to JSON and spliced in, skipping the model_dump() dict
+    if isinstance(obj, BaseModel):
+        return orjson.Fragment(obj.model_dump_json())
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def encode_event(event: WSEvent) -> str:
+    """Encode a WSEvent as a JSON text frame.
+
+    Produces the same JSON as event.model_dump_json(), but dumps the
+    envelope with orjson instead of going through pydantic's serializer.
+    Payloads hold JSON-compatible data (dicts, lists, str-enums) or
+    pydantic models, which are encoded with their own model_dump_json().
+    """
+    return orjson.dumps({
+        "type": event.type,
+        "payload": event.payload,
+        "timestamp": event.timestamp,
+    }, default=_encode_model).decode()
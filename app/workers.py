@@ -0,0 +1,24 @@
+from uvicorn_worker import UvicornWorker as BaseUvicornWorker
+
+class UvicornWorker(BaseUvicornWorker):
+    """Gunicorn worker used by gunicorn_conf.py.
+
+    Same as the stock Uvicorn worker, minus the `server: uvicorn` header
+    that would otherwise be sent on every response, and with Gunicorn's
+    `worker_connections` applied as Uvicorn's `limit_concurrency` (the
+    stock worker ignores it). The loop is pinned to uvloop like start.py,
+    so a missing uvloop fails at boot instead of quietly falling back
+    to asyncio's default loop, and WebSocket compression is off as in
+    start.py.
+    """
+
+    CONFIG_KWARGS = {
+        **BaseUvicornWorker.CONFIG_KWARGS,
+        "loop": "uvloop",
+        "server_header": False,
+        "ws_per_message_deflate": False,
+    }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.config.limit_concurrency = self.cfg.worker_connections
@@ -0,0 +1,37 @@
+"""
+Gunicorn configuration for production deployments.
+
+Usage:
+    gunicorn app.main:app -c gunicorn_conf.py
+"""
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 8000)}"
+worker_class = "app.workers.UvicornWorker"
+
+# Lobbies and WebSocket connections live in process memory (see
+# app/utils/storage.py), so each worker would see its own set of lobbies.
+# Keep a single worker until storage is shared (e.g. Redis), then set
+# WEB_CONCURRENCY=auto for 2 * cores + 1 workers.
+_web_concurrency = os.environ.get("WEB_CONCURRENCY", "1")
+if _web_concurrency == "auto":
+    workers = multiprocessing.cpu_count() * 2 + 1
+else:
+    workers = int(_web_concurrency)
+
+# Load balancers and health probes reuse connections; keep them open
+# longer than a typical LB idle timeout (60s) so we never close first
+keepalive = 75
+backlog = 4096
+# Per-worker cap on open connections (503 beyond it), see app/workers.py
+worker_connections = 2048
+
+# Worker recycling to bound RSS growth. Off by default: a recycled worker
+# takes its in-memory lobbies and open WebSockets with it. Once storage is
+# shared, set MAX_REQUESTS=10000 (jitter keeps workers from restarting together).
+max_requests = int(os.environ.get("MAX_REQUESTS", 0))
+max_requests_jitter = int(os.environ.get("MAX_REQUESTS_JITTER", 1000))
+
+# Seconds an exiting worker gets to finish in-flight requests before SIGKILL
+graceful_timeout = 30
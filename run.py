@@ -4,13 +4,19 @@ Simple runner script for the Party Game Platform.
 Use this for development or as a template for production deployment.
 """
 
+import os
 import uvicorn
 
 if __name__ == "__main__":
+    # Dev runs get /docs; production leaves DEBUG unset
+    os.environ.setdefault("DEBUG", "1")
     uvicorn.run(
         "app.main:app",
         host="127.0.0.1",
         port=8000,
         reload=True,
+        # uvloop + httptools when installed (they aren't on Windows)
+        loop="auto",
+        http="auto",
         log_level="info"
     )
@@ -7,9 +7,22 @@ import uvicorn
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
+    # Opt-in: exiting after N requests also drops the in-memory lobbies
+    max_requests = int(os.environ.get("MAX_REQUESTS", 0)) or None
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=port,
+        loop="uvloop",  # libuv-backed event loop
+        http="httptools",  # C HTTP parser
+        server_header=False,
+        # Frames are small JSON and broadcasts send the same text to every
+        # socket; per-connection deflate would compress it once per client
+        ws_per_message_deflate=False,
+        timeout_keep_alive=75,  # outlive LB idle timeouts so probes reuse connections
+        backlog=4096,
+        limit_concurrency=2048,
+        limit_max_requests=max_requests,
+        timeout_graceful_shutdown=30,
         log_level="info"
     )
@@ -15,6 +15,7 @@ class GameClient {
         this.hostToken = null;
         this.hasBuzzed = false;
         this.currentBuzzers = []; // Store current round's buzzer data
+        this.liveBuzzers = []; // Buzzers so far this question, built from live_buzzers updates
         
         this.init();
     }
@@ -217,6 +218,12 @@ class GameClient {
     updateLobbyDisplay(lobby) {
         this.currentLobby = lobby;
         
+        // live_buzzers only carries new entries, so pick up the ones we
+        // missed (e.g. after reconnecting mid-question) from the lobby state
+        if (lobby.current_game && lobby.current_game.buzzers) {
+            this.liveBuzzers = lobby.current_game.buzzers.slice();
+        }
+        
         document.getElementById('lobbyTitle').textContent = `Room: ${lobby.lobby_name}`;
         
         const playersEl = document.getElementById('playersList');
@@ -394,6 +401,22 @@ class GameClient {
         document.getElementById('gameTimer').textContent = `Starting in ${payload.countdown}...`;
         document.getElementById('gameStatus').textContent = 'Get ready to tap!';
         document.getElementById('tapButton').disabled = true;
+        this.runStartCountdown(payload.countdown);
+    }
+    
+    runStartCountdown(seconds) {
+        // The server only announces the countdown (in game_started), so
+        // tick it down locally until its "TAP NOW!" arrives
+        clearInterval(this.startCountdownInterval);
+        let remaining = seconds;
+        this.startCountdownInterval = setInterval(() => {
+            remaining -= 1;
+            if (remaining <= 0 || this.gameState !== 'starting') {
+                clearInterval(this.startCountdownInterval);
+                return;
+            }
+            document.getElementById('gameTimer').textContent = `Starting in ${remaining}...`;
+        }, 1000);
     }
     
     setupBuzzerTriviaUI(payload) {
@@ -452,6 +475,7 @@ class GameClient {
                 console.log(`🔄 BUZZER CLEARED EVENT - Resetting hasBuzzed for ${this.currentPlayer}`);
                 console.log(`hasBuzzed before reset: ${this.hasBuzzed}`);
                 this.hasBuzzed = false;
+                this.liveBuzzers = [];
                 console.log(`hasBuzzed after reset: ${this.hasBuzzed}`);
                 
                 // Re-enable the buzzer button
@@ -613,12 +637,17 @@ class GameClient {
             return;
         }
         
-        console.log('Live buzzers update:', payload.buzzers);
-        console.log('RAW BUZZER DATA:', JSON.stringify(payload.buzzers, null, 2));
+        // The server only sends the buzzers added since its last update,
+        // starting at index payload.start of the full list
+        this.liveBuzzers.splice(payload.start, Infinity, ...payload.added);
+        const buzzers = this.liveBuzzers;
+        
+        console.log('Live buzzers update:', payload.added, `(${buzzers.length}/${payload.count})`);
+        console.log('RAW BUZZER DATA:', JSON.stringify(buzzers, null, 2));
         
         // DEBUG: Log each buzzer's time and player for sorting debug
-        if (payload.buzzers) {
-            payload.buzzers.forEach((buzzer, i) => {
+        if (buzzers) {
+            buzzers.forEach((buzzer, i) => {
                 console.log(`BUZZER ${i}: player=${buzzer.player}, time=${buzzer.time}, position=${buzzer.position}`);
             });
         }
@@ -634,13 +663,10 @@ class GameClient {
         liveBuzzersDiv.innerHTML = '';
         console.log('Cleared buzzer list content');
         
-        if (payload.buzzers && payload.buzzers.length > 0) {
-            console.log(`Processing ${payload.buzzers.length} buzzers`);
-            // Sort by time (earliest first) to get correct order
-            const sortedBuzzers = [...payload.buzzers].sort((a, b) => a.time - b.time);
-            console.log('Sorted buzzers:', sortedBuzzers);
-            
-            sortedBuzzers.forEach((buzzer, index) => {
+        if (buzzers.length > 0) {
+            console.log(`Processing ${buzzers.length} buzzers`);
+            // The server sends buzzers in the order it received them
+            buzzers.forEach((buzzer, index) => {
                 console.log(`Creating buzzer item for ${buzzer.player} at position ${index + 1}`);
                 const buzzerDiv = document.createElement('div');
                 buzzerDiv.className = 'result-item';
@@ -667,7 +693,7 @@ class GameClient {
         }
         
         // Keep buzzer active for players who haven't buzzed yet
-        if (payload.keep_buzzing && !payload.buzzers.some(b => b.player === this.currentPlayer)) {
+        if (payload.keep_buzzing && !buzzers.some(b => b.player === this.currentPlayer)) {
             document.getElementById('buzzerButton').disabled = false;
             document.getElementById('buzzerButton').style.background = '#ff6b6b';
             document.getElementById('buzzerSection').classList.remove('hidden');
@@ -898,7 +924,9 @@ class GameClient {
     // AI Question generation removed - using static question bank only
     
     startCountdown(seconds) {
-        // Visual countdown display
+        // Visual countdown display. The server can close the buzzer window
+        // early, so stop any countdown still running from the last one.
+        clearInterval(this.countdownInterval);
         this.countdownInterval = setInterval(() => {
             const countdownEl = document.getElementById('countdownNumber');
             if (countdownEl) {
@@ -961,8 +989,10 @@ class GameClient {
                 `${Math.ceil(payload.remaining_time)}s remaining`;
         }
         
-        if (payload.scores && this.currentPlayer && payload.scores[this.currentPlayer] !== undefined) {
-            this.tapCount = payload.scores[this.currentPlayer];
+        // Full snapshot every few ticks, only changed counts in between
+        const scores = payload.scores || payload.scores_delta;
+        if (scores && this.currentPlayer && scores[this.currentPlayer] !== undefined) {
+            this.tapCount = scores[this.currentPlayer];
             document.getElementById('scoreDisplay').textContent = `${this.tapCount} taps`;
         }
     }
@@ -980,6 +1010,10 @@ class GameClient {
             action: 'tap',
             timestamp: now / 1000
         });
+        
+        // Optimistic count; the server's tick scores are authoritative
+        this.tapCount++;
+        document.getElementById('scoreDisplay').textContent = `${this.tapCount} taps`;
     }
     
     showResults(results) {